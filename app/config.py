@@ -8,10 +8,21 @@ class Settings(BaseSettings):
 
     Attributes:
         DATABASE_URL: PostgreSQL async connection string.
+        DATABASE_REPLICA_URLS: Comma-separated read replica connection
+            strings (optional). Read-only endpoints are spread across them
+            round-robin; empty means all queries use DATABASE_URL.
         SECRET_KEY: Secret key for JWT token signing.
         ALGORITHM: JWT signing algorithm.
         ACCESS_TOKEN_EXPIRE_MINUTES: Token expiration time in minutes.
+        BCRYPT_ROUNDS: bcrypt cost factor for new password hashes (the test
+            suite lowers it; existing hashes keep the cost they were made with).
         DEBUG: Enable debug mode.
+        DB_POOL_SIZE: Persistent connections kept in the PostgreSQL pool.
+        DB_MAX_OVERFLOW: Extra connections allowed beyond DB_POOL_SIZE.
+        DB_POOL_TIMEOUT: Seconds to wait for a free pooled connection.
+        DB_POOL_RECYCLE: Seconds before a pooled connection is replaced.
+        DB_STATEMENT_CACHE_SIZE: asyncpg prepared statement cache size per
+            connection (set to 0 behind PgBouncer transaction pooling).
         TMDB_API_KEY: API key for The Movie Database (TMDB).
         TMDB_BASE_URL: Base URL for TMDB API.
         TMDB_IMAGE_BASE_URL: Base URL for TMDB image assets.
@@ -21,11 +32,20 @@ class Settings(BaseSettings):
     """
 
     DATABASE_URL: str
+    DATABASE_REPLICA_URLS: str = ""
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440
+    BCRYPT_ROUNDS: int = 12
     DEBUG: bool = False
 
+    # Database connection pool settings (PostgreSQL, non-Lambda only)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+
     # TMDB API settings
     TMDB_API_KEY: str
     TMDB_BASE_URL: str = "https://api.themoviedb.org/3"
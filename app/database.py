@@ -2,10 +2,12 @@
 
 import os
 from collections.abc import AsyncGenerator
+from itertools import cycle
 from typing import Annotated
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -19,39 +21,73 @@ from app.config import settings
 IS_LAMBDA = os.environ.get("AWS_LAMBDA_FUNCTION_NAME") is not None
 IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
 
-# Create async engine with environment-appropriate pooling
-# SQLite (testing): Use StaticPool for in-memory database
-# Lambda: Use NullPool (no connection pooling) since each invocation is isolated
-# Local/Docker PostgreSQL: Use connection pooling for better performance
-if IS_SQLITE:
-    engine = create_async_engine(
-        settings.DATABASE_URL,
-        echo=settings.DEBUG,
-        poolclass=StaticPool,
-        connect_args={"check_same_thread": False},
-    )
-elif IS_LAMBDA:
-    engine = create_async_engine(
-        settings.DATABASE_URL,
-        echo=settings.DEBUG,
-        poolclass=NullPool,
-    )
-else:
-    engine = create_async_engine(
-        settings.DATABASE_URL,
+
+def create_engine_for_url(url: str) -> AsyncEngine:
+    """Create an async engine with environment-appropriate pooling.
+
+    SQLite (testing): Use StaticPool for in-memory database
+    Lambda: Use NullPool (no connection pooling) since each invocation is isolated
+    Local/Docker PostgreSQL: Use connection pooling for better performance
+
+    Args:
+        url: Database connection string.
+
+    Returns:
+        The configured AsyncEngine.
+    """
+    if url.startswith("sqlite"):
+        return create_async_engine(
+            url,
+            echo=settings.DEBUG,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+    if IS_LAMBDA:
+        return create_async_engine(
+            url,
+            echo=settings.DEBUG,
+            poolclass=NullPool,
+        )
+    return create_async_engine(
+        url,
         echo=settings.DEBUG,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args={
+            # asyncpg's own statement cache and SQLAlchemy's prepared
+            # statement cache; both must be 0 behind PgBouncer
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
     )
 
-# Create async session factory
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
+
+def create_session_maker(bind: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create the async session factory used for an engine."""
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+# Primary database (all writes)
+engine = create_engine_for_url(settings.DATABASE_URL)
+async_session_maker = create_session_maker(engine)
+
+# Read replicas for read-only endpoints, used round-robin
+replica_engines: list[AsyncEngine] = [
+    create_engine_for_url(url.strip())
+    for url in settings.DATABASE_REPLICA_URLS.split(",")
+    if url.strip()
+]
+_replica_session_makers = cycle(
+    [create_session_maker(replica) for replica in replica_engines]
 )
 
 
@@ -84,5 +120,24 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-# Type alias for dependency injection
+async def get_replica_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency that provides a read-only session on the next replica.
+
+    Nothing is committed; the session is rolled back when closed.
+
+    Yields:
+        AsyncSession: An async SQLAlchemy session bound to a read replica.
+    """
+    async with next(_replica_session_makers)() as session:
+        yield session
+
+
+# Read-only endpoints depend on get_read_db. Without replicas it is get_db
+# itself, so reads use the primary and dependency overrides of get_db (as
+# in tests) apply to them too. Replicas may lag the primary slightly, so
+# only use it where reading a just-written row is not required.
+get_read_db = get_replica_db if replica_engines else get_db
+
+# Type aliases for dependency injection
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
@@ -6,6 +6,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.database import DbSession
 from app.models.user import User
@@ -45,7 +46,10 @@ async def get_current_user(
     except TokenError:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    # The user's rankings are never read from here; skip the selectin load
+    result = await db.execute(
+        select(User).options(raiseload(User.rankings)).where(User.id == user_id)
+    )
     user = result.scalar_one_or_none()
 
     if user is None:
@@ -10,8 +10,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
 from app.config import settings
-from app.database import engine
+from app.database import engine, replica_engines
 from app.routers import analytics, auth, google_auth, import_amazon, movies, rankings
+from app.schemas.ranking import ranking_with_movie_list_adapter
+from app.services.tmdb import close_http_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO if not settings.DEBUG else logging.DEBUG)
@@ -26,15 +28,36 @@ if os.environ.get("CORS_ORIGIN"):
     ALLOWED_ORIGINS.append(os.environ["CORS_ORIGIN"])
 
 
+def warm_up(app: FastAPI) -> None:
+    """Do one-off schema work up front so the first requests don't pay for it.
+
+    Called from the lifespan, and at import time by the Lambda handler,
+    which runs with lifespan events disabled.
+
+    Args:
+        app: The FastAPI application instance.
+    """
+    # Warm up deferred schemas used on every ranking list and movie search
+    ranking_with_movie_list_adapter.rebuild()
+    movies.tmdb_search_results_adapter.rebuild()
+
+    # FastAPI caches the generated schema on the app, so the first request
+    # to /docs or /openapi.json doesn't pay for walking every response model
+    app.openapi()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown events.
 
     On startup:
         - Verifies database connection is working
+        - Builds the validators for the hot list and search endpoints
+        - Generates and caches the OpenAPI schema
 
     On shutdown:
         - Disposes of the database engine connection pool
+        - Closes the shared TMDB HTTP client
 
     Args:
         app: The FastAPI application instance.
@@ -52,12 +75,17 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to connect to database: {e}")
         raise
 
+    warm_up(app)
+
     yield
 
     # Shutdown: Clean up database connections
     logger.info("Shutting down Movie Ranking API...")
     await engine.dispose()
+    for replica in replica_engines:
+        await replica.dispose()
     logger.info("Database connections closed")
+    await close_http_client()
 
 
 # Create FastAPI application
@@ -7,7 +7,7 @@ from typing import Optional
 from fastapi import APIRouter, Query
 from sqlalchemy import func, select, cast, Date
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager, raiseload
 
 from app.database import DbSession
 from app.dependencies import CurrentUser
@@ -153,14 +153,18 @@ async def get_genres(
     # Query rankings with movies for the year
     result = await db.execute(
         select(Ranking)
-        .options(joinedload(Ranking.movie))
+        .join(Ranking.movie)
+        .options(
+            contains_eager(Ranking.movie).raiseload(Movie.rankings),
+            raiseload(Ranking.user),
+        )
         .where(
             Ranking.user_id == current_user.id,
             cast(Ranking.rated_at, Date) >= start_date,
             cast(Ranking.rated_at, Date) <= end_date,
         )
     )
-    rankings = result.scalars().unique().all()
+    rankings = result.scalars().all()
 
     # Aggregate by primary genre (first genre in list, most relevant per TMDB)
     genre_counts: dict[int, int] = defaultdict(int)
@@ -271,14 +275,18 @@ async def _get_top_genre(db: AsyncSession, user_id) -> str | None:
     # Query rankings with movies for the rolling year
     result = await db.execute(
         select(Ranking)
-        .options(joinedload(Ranking.movie))
+        .join(Ranking.movie)
+        .options(
+            contains_eager(Ranking.movie).raiseload(Movie.rankings),
+            raiseload(Ranking.user),
+        )
         .where(
             Ranking.user_id == user_id,
             cast(Ranking.rated_at, Date) >= start_date,
             cast(Ranking.rated_at, Date) <= end_date,
         )
     )
-    rankings = result.scalars().unique().all()
+    rankings = result.scalars().all()
 
     if not rankings:
         return None
@@ -422,10 +430,10 @@ async def get_rating_distribution(
     rating_counts = {row.rating: row.count for row in rows}
 
     # Build distribution with all 5 rating values (1-5)
-    distribution = [
+    distribution = tuple(
         RatingCount(rating=rating, count=rating_counts.get(rating, 0))
         for rating in range(1, 6)
-    ]
+    )
 
     # Calculate total
     total = sum(rc.count for rc in distribution)
@@ -11,7 +11,11 @@ from app.dependencies import CurrentUser
 from app.models.user import User
 from app.schemas.token import Token
 from app.schemas.user import UserCreate, UserProfileResponse
-from app.utils.security import create_access_token, get_password_hash, verify_password
+from app.utils.security import (
+    create_access_token,
+    get_password_hash,
+    verify_password_or_dummy,
+)
 
 router = APIRouter(tags=["auth"])
 
@@ -41,10 +45,10 @@ async def register(user_data: UserCreate, db: DbSession) -> Token:
         HTTPException: 409 Conflict if email is already registered.
     """
     # Check if email already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    existing_user = result.scalar_one_or_none()
+    result = await db.execute(select(User.id).where(User.email == user_data.email))
+    existing_user_id = result.scalar_one_or_none()
 
-    if existing_user is not None:
+    if existing_user_id is not None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered",
@@ -98,13 +102,12 @@ async def login(
     result = await db.execute(select(User).where(User.email == form_data.username))
     user = result.scalar_one_or_none()
 
-    # Verify user exists and password matches
+    # Verify user exists and password matches. Unknown emails still run a
+    # bcrypt check so they take as long as a wrong password.
     # Note: Users without a password (Google-only) cannot use password login
-    if (
-        user is None
-        or user.hashed_password is None
-        or not verify_password(form_data.password, user.hashed_password)
-    ):
+    hashed_password = user.hashed_password if user is not None else None
+    password_ok = verify_password_or_dummy(form_data.password, hashed_password)
+    if user is None or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
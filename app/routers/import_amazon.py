@@ -6,6 +6,7 @@ from Amazon Prime Video CSV exports.
 Endpoints:
 - POST /amazon-prime/upload/ - Upload CSV, parse, and match with TMDB
 - GET /amazon-prime/session/{session_id}/ - Get current session state
+- GET /amazon-prime/session/{session_id}/movies/ - Get a page of session movies
 - POST /amazon-prime/session/{session_id}/movie/{index}/add/ - Add movie with rating
 - POST /amazon-prime/session/{session_id}/movie/{index}/skip/ - Skip movie
 - PATCH /amazon-prime/session/{session_id}/movie/{index}/match/ - Update movie's TMDB match
@@ -16,9 +17,8 @@ import asyncio
 import logging
 from datetime import date, datetime, timezone
 from difflib import SequenceMatcher
-from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, UploadFile, status
+from fastapi import APIRouter, HTTPException, Query, UploadFile, status
 from sqlalchemy import select
 
 from app.database import DbSession
@@ -29,20 +29,41 @@ from app.schemas.import_amazon import (
     ImportMovieAddRequest,
     ImportMovieMatchRequest,
     ImportSessionDetailResponse,
+    ImportSessionMoviesPage,
     ImportSessionResponse,
     MatchedMovieItem,
+    MovieStatus,
     ParsedMovieItem,
     TMDBMatchResult,
 )
 from app.schemas.ranking import RankingResponse
-from app.services.csv_parser import parse_amazon_prime_csv
+from app.services.csv_parser import ParsedMovie, parse_amazon_prime_csv
 from app.services.import_session import import_session_store
-from app.services.tmdb import TMDBRateLimitError, TMDBService, get_movie_details
+from app.services.tmdb import (
+    TMDBMovieResult,
+    TMDBRateLimitError,
+    TMDBService,
+    get_movie_details,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["import"])
 
+# Matches at or above this confidence (exact title + year) are almost always
+# accepted as-is, so alternatives are not collected for them.
+ALTERNATIVES_CONFIDENCE_THRESHOLD = 0.95
+
+# Wait before retrying a rate-limited search: TMDB's Retry-After if given,
+# capped so one slow response can't stall the whole upload request
+RATE_LIMIT_RETRY_DEFAULT_SECONDS = 2.0
+RATE_LIMIT_RETRY_MAX_SECONDS = 10.0
+
+# TMDB searches one upload may have in flight at once. Imports also run as
+# background work in the TMDB rate limiter, so interactive searches keep a
+# reserved share of the rate while an upload is matching.
+IMPORT_MAX_CONCURRENT_SEARCHES = 4
+
 
 def to_naive_utc(dt: datetime | None) -> datetime | None:
     """Convert a datetime to naive UTC datetime for database storage.
@@ -112,199 +133,184 @@ def calculate_confidence(
     return min(score, 1.0)
 
 
-async def match_movies_with_tmdb(
-    parsed_movies: list,
-    user_id: UUID,
-    db: DbSession,
-) -> tuple[list[MatchedMovieItem], int]:
-    """Match parsed movies against TMDB with rate limiting.
+def build_match_result(result: TMDBMovieResult) -> TMDBMatchResult:
+    """Convert a TMDB service result into a TMDBMatchResult.
+
+    TMDB results are produced by our own service layer, so the schema is
+    built with model_construct() to skip re-validating trusted data.
 
     Args:
-        parsed_movies: List of ParsedMovie objects from CSV parser.
-        user_id: Current user's ID for checking existing rankings.
-        db: Database session.
+        result: Search result from TMDBService.
 
     Returns:
-        Tuple of (matched movies list, already_ranked count).
+        TMDBMatchResult with the same TMDB metadata.
     """
-    matched: list[MatchedMovieItem] = []
-    already_ranked = 0
+    return TMDBMatchResult.model_construct(
+        tmdb_id=result.tmdb_id,
+        title=result.title,
+        year=result.year,
+        poster_url=result.poster_url,
+        overview=result.overview,
+        genre_ids=result.genre_ids,
+        vote_average=result.vote_average,
+        vote_count=result.vote_count,
+        release_date=result.release_date,
+        original_language=result.original_language,
+    )
 
-    # Get user's existing ranked movie TMDB IDs
-    existing_result = await db.execute(
-        select(Movie.tmdb_id)
-        .join(Ranking, Ranking.movie_id == Movie.id)
-        .where(Ranking.user_id == user_id)
+
+def build_matched_item(
+    movie: ParsedMovie,
+    tmdb_match: TMDBMatchResult | None = None,
+    confidence: float = 0.0,
+    alternatives: list[TMDBMatchResult] | None = None,
+) -> MatchedMovieItem:
+    """Build a pending MatchedMovieItem for a parsed CSV movie.
+
+    Uses model_construct() since every input comes from the CSV parser
+    or the TMDB service rather than from the client.
+
+    Args:
+        movie: Movie parsed from the CSV.
+        tmdb_match: Best TMDB match, or None if no match was found.
+        confidence: Match confidence score (0.0 - 1.0).
+        alternatives: Alternative TMDB matches for user selection.
+
+    Returns:
+        MatchedMovieItem in the "pending" state.
+    """
+    return MatchedMovieItem.model_construct(
+        parsed=ParsedMovieItem.model_construct(
+            title=movie.title,
+            watch_date=movie.watch_date,
+            prime_image_url=movie.prime_image_url,
+        ),
+        tmdb_match=tmdb_match,
+        confidence=confidence,
+        alternatives=alternatives if alternatives is not None else [],
+        status=MovieStatus.PENDING,
     )
-    existing_tmdb_ids = set(row[0] for row in existing_result.all())
 
-    async with TMDBService() as service:
-        for i, movie in enumerate(parsed_movies):
-            try:
-                # Rate limiting: delay every 35 requests
-                if i > 0 and i % 35 == 0:
-                    await asyncio.sleep(1.0)
 
-                results = await service.search_movies(
-                    query=movie.title,
-                    year=movie.year,
-                )
+async def match_movie_with_tmdb(
+    service: TMDBService,
+    movie: ParsedMovie,
+    existing_tmdb_ids: set[int],
+) -> MatchedMovieItem | None:
+    """Match a single parsed movie against TMDB.
+
+    Args:
+        service: Open TMDBService to search with.
+        movie: Movie parsed from the CSV.
+        existing_tmdb_ids: TMDB IDs of movies the user has already ranked.
+
+    Returns:
+        MatchedMovieItem for review, or None if the best match is a movie
+        the user has already ranked.
+    """
+    try:
+        results = await service.search_movies(
+            query=movie.title,
+            year=movie.year,
+        )
 
-                if results:
-                    best_match = results[0]
-                    confidence = calculate_confidence(
+        if results:
+            best_match = results[0]
+            confidence = calculate_confidence(
+                movie.title,
+                movie.year,
+                best_match.title,
+                best_match.year,
+            )
+
+            # Skip already-ranked movies
+            if best_match.tmdb_id in existing_tmdb_ids:
+                return None
+
+            return build_matched_item(
+                movie,
+                tmdb_match=build_match_result(best_match),
+                confidence=confidence,
+                alternatives=(
+                    []
+                    if confidence >= ALTERNATIVES_CONFIDENCE_THRESHOLD
+                    else [
+                        build_match_result(r)
+                        for r in results[1:3]  # Up to 2 alternatives
+                    ]
+                ),
+            )
+
+        # No TMDB match found
+        return build_matched_item(movie)
+
+    except TMDBRateLimitError as e:
+        # Wait as long as TMDB asked (within reason) and retry once
+        delay = min(
+            e.retry_after
+            if e.retry_after is not None
+            else RATE_LIMIT_RETRY_DEFAULT_SECONDS,
+            RATE_LIMIT_RETRY_MAX_SECONDS,
+        )
+        logger.warning(
+            f"Rate limited matching '{movie.title}', waiting {delay:g} seconds..."
+        )
+        await asyncio.sleep(delay)
+        try:
+            results = await service.search_movies(query=movie.title)
+            if results:
+                best_match = results[0]
+                if best_match.tmdb_id in existing_tmdb_ids:
+                    return None
+                return build_matched_item(
+                    movie,
+                    tmdb_match=build_match_result(best_match),
+                    confidence=calculate_confidence(
                         movie.title,
                         movie.year,
                         best_match.title,
                         best_match.year,
-                    )
-
-                    # Check if already ranked
-                    if best_match.tmdb_id in existing_tmdb_ids:
-                        already_ranked += 1
-                        continue  # Skip already-ranked movies
-
-                    matched.append(
-                        MatchedMovieItem(
-                            parsed=ParsedMovieItem(
-                                title=movie.title,
-                                watch_date=movie.watch_date,
-                                prime_image_url=movie.prime_image_url,
-                            ),
-                            tmdb_match=TMDBMatchResult(
-                                tmdb_id=best_match.tmdb_id,
-                                title=best_match.title,
-                                year=best_match.year,
-                                poster_url=best_match.poster_url,
-                                overview=best_match.overview,
-                                genre_ids=best_match.genre_ids,
-                                vote_average=best_match.vote_average,
-                                vote_count=best_match.vote_count,
-                                release_date=best_match.release_date,
-                                original_language=best_match.original_language,
-                            ),
-                            confidence=confidence,
-                            alternatives=[
-                                TMDBMatchResult(
-                                    tmdb_id=r.tmdb_id,
-                                    title=r.title,
-                                    year=r.year,
-                                    poster_url=r.poster_url,
-                                    overview=r.overview,
-                                    genre_ids=r.genre_ids,
-                                    vote_average=r.vote_average,
-                                    vote_count=r.vote_count,
-                                    release_date=r.release_date,
-                                    original_language=r.original_language,
-                                )
-                                for r in results[1:3]  # Up to 2 alternatives
-                            ],
-                            status="pending",
-                        )
-                    )
-                else:
-                    # No TMDB match found
-                    matched.append(
-                        MatchedMovieItem(
-                            parsed=ParsedMovieItem(
-                                title=movie.title,
-                                watch_date=movie.watch_date,
-                                prime_image_url=movie.prime_image_url,
-                            ),
-                            tmdb_match=None,
-                            confidence=0.0,
-                            alternatives=[],
-                            status="pending",
-                        )
-                    )
-
-            except TMDBRateLimitError:
-                # Wait and retry once
-                logger.warning(f"Rate limited on movie {i}, waiting 2 seconds...")
-                await asyncio.sleep(2.0)
-                try:
-                    results = await service.search_movies(query=movie.title)
-                    if results:
-                        best_match = results[0]
-                        if best_match.tmdb_id not in existing_tmdb_ids:
-                            matched.append(
-                                MatchedMovieItem(
-                                    parsed=ParsedMovieItem(
-                                        title=movie.title,
-                                        watch_date=movie.watch_date,
-                                        prime_image_url=movie.prime_image_url,
-                                    ),
-                                    tmdb_match=TMDBMatchResult(
-                                        tmdb_id=best_match.tmdb_id,
-                                        title=best_match.title,
-                                        year=best_match.year,
-                                        poster_url=best_match.poster_url,
-                                        overview=best_match.overview,
-                                        genre_ids=best_match.genre_ids,
-                                        vote_average=best_match.vote_average,
-                                        vote_count=best_match.vote_count,
-                                        release_date=best_match.release_date,
-                                        original_language=best_match.original_language,
-                                    ),
-                                    confidence=calculate_confidence(
-                                        movie.title,
-                                        movie.year,
-                                        best_match.title,
-                                        best_match.year,
-                                    ),
-                                    alternatives=[],
-                                    status="pending",
-                                )
-                            )
-                        else:
-                            already_ranked += 1
-                    else:
-                        matched.append(
-                            MatchedMovieItem(
-                                parsed=ParsedMovieItem(
-                                    title=movie.title,
-                                    watch_date=movie.watch_date,
-                                    prime_image_url=movie.prime_image_url,
-                                ),
-                                tmdb_match=None,
-                                confidence=0.0,
-                                alternatives=[],
-                                status="pending",
-                            )
-                        )
-                except TMDBRateLimitError:
-                    # Still rate limited, mark as unmatched
-                    matched.append(
-                        MatchedMovieItem(
-                            parsed=ParsedMovieItem(
-                                title=movie.title,
-                                watch_date=movie.watch_date,
-                                prime_image_url=movie.prime_image_url,
-                            ),
-                            tmdb_match=None,
-                            confidence=0.0,
-                            alternatives=[],
-                            status="pending",
-                        )
-                    )
-
-            except Exception as e:
-                logger.error(f"Error matching movie '{movie.title}': {e}")
-                matched.append(
-                    MatchedMovieItem(
-                        parsed=ParsedMovieItem(
-                            title=movie.title,
-                            watch_date=movie.watch_date,
-                            prime_image_url=movie.prime_image_url,
-                        ),
-                        tmdb_match=None,
-                        confidence=0.0,
-                        alternatives=[],
-                        status="pending",
-                    )
+                    ),
                 )
+            return build_matched_item(movie)
+        except TMDBRateLimitError:
+            # Still rate limited, mark as unmatched
+            return build_matched_item(movie)
+
+    except Exception as e:
+        logger.error(f"Error matching movie '{movie.title}': {e}")
+        return build_matched_item(movie)
+
 
-    return matched, already_ranked
+async def match_movies_with_tmdb(
+    parsed_movies: list[ParsedMovie],
+    existing_tmdb_ids: set[int],
+) -> tuple[list[MatchedMovieItem], int]:
+    """Match parsed movies against TMDB concurrently.
+
+    Up to IMPORT_MAX_CONCURRENT_SEARCHES searches run at once, as background
+    work in the service's process-wide rate limiter, and identical titles
+    share one request. The import paces itself to TMDB's limits without
+    crowding out interactive searches from other users.
+
+    Args:
+        parsed_movies: List of ParsedMovie objects from CSV parser.
+        existing_tmdb_ids: TMDB IDs of movies the user has already ranked.
+
+    Returns:
+        Tuple of (matched movies list in CSV order, already_ranked count).
+    """
+    semaphore = asyncio.Semaphore(IMPORT_MAX_CONCURRENT_SEARCHES)
+
+    async def match(movie: ParsedMovie) -> MatchedMovieItem | None:
+        async with semaphore:
+            return await match_movie_with_tmdb(service, movie, existing_tmdb_ids)
+
+    async with TMDBService(background=True) as service:
+        results = await asyncio.gather(*(match(movie) for movie in parsed_movies))
+
+    matched = [item for item in results if item is not None]
+    return matched, len(results) - len(matched)
 
 
 @router.post(
@@ -347,8 +353,16 @@ async def upload_amazon_prime_csv(
             detail="File must be a CSV file",
         )
 
-    # Parse CSV
-    parse_result = parse_amazon_prime_csv(file.file)
+    # Parse CSV in a worker thread while fetching the user's already-ranked
+    # TMDB IDs, since the two are independent
+    parse_result, existing_result = await asyncio.gather(
+        asyncio.to_thread(parse_amazon_prime_csv, file.file),
+        db.execute(
+            select(Movie.tmdb_id)
+            .join(Ranking, Ranking.movie_id == Movie.id)
+            .where(Ranking.user_id == current_user.id)
+        ),
+    )
 
     if parse_result.total_entries == 0:
         raise HTTPException(
@@ -363,23 +377,25 @@ async def upload_amazon_prime_csv(
         )
 
     # Match movies with TMDB
+    existing_tmdb_ids = set(existing_result.scalars().all())
     matched_movies, already_ranked = await match_movies_with_tmdb(
         parse_result.movies,
-        current_user.id,
-        db,
+        existing_tmdb_ids,
     )
 
     # Create session
     session_id = import_session_store.create_session(
         user_id=str(current_user.id),
-        movies=[m.model_dump() for m in matched_movies],
+        movies=matched_movies,
         total_entries=parse_result.total_entries,
         movies_found=parse_result.movies_found,
         tv_shows_filtered=parse_result.tv_shows_filtered,
         already_ranked=already_ranked,
     )
 
-    return ImportSessionResponse(
+    # Matched items were built with model_construct from trusted data, so
+    # skip re-validating them inside the envelope
+    return ImportSessionResponse.model_construct(
         session_id=session_id,
         total_entries=parse_result.total_entries,
         movies_found=parse_result.movies_found,
@@ -403,12 +419,19 @@ async def upload_amazon_prime_csv(
 async def get_import_session(
     session_id: str,
     current_user: CurrentUser,
+    include_movies: bool = Query(
+        default=True,
+        description="Include the full movie list; disable when polling progress",
+    ),
 ) -> ImportSessionDetailResponse:
     """Get the current state of an import session.
 
     Args:
         session_id: The unique import session ID.
         current_user: The authenticated user (from JWT token).
+        include_movies: Whether to include every movie in the response.
+            Clients that only need progress counts, or that page through
+            movies with the /movies/ endpoint, can turn this off.
 
     Returns:
         ImportSessionDetailResponse with session state and movies.
@@ -424,17 +447,67 @@ async def get_import_session(
             detail="Import session not found or expired",
         )
 
-    movies = [MatchedMovieItem(**m) for m in session.movies]
-    pending_count = sum(1 for m in movies if m.status == "pending")
+    # Items only leave "pending" through add/skip, which bump these counters
+    total_movies = len(session.movies)
+    pending_count = total_movies - session.added_count - session.skipped_count
 
-    return ImportSessionDetailResponse(
+    return ImportSessionDetailResponse.model_construct(
         session_id=session_id,
         current_index=session.current_index,
-        total_movies=len(movies),
+        total_movies=total_movies,
         added_count=session.added_count,
         skipped_count=session.skipped_count,
         remaining_count=pending_count,
-        movies=movies,
+        movies=session.movies if include_movies else [],
+    )
+
+
+@router.get(
+    "/amazon-prime/session/{session_id}/movies/",
+    response_model=ImportSessionMoviesPage,
+    summary="Get a page of import session movies",
+    responses={
+        200: {"description": "Movies retrieved successfully"},
+        401: {"description": "Not authenticated"},
+        404: {"description": "Session not found or expired"},
+    },
+)
+async def get_import_session_movies(
+    session_id: str,
+    current_user: CurrentUser,
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+) -> ImportSessionMoviesPage:
+    """Get a window of movies from an import session.
+
+    Only the requested slice is serialized, so the cost of a request does
+    not grow with the size of the uploaded watch history.
+
+    Args:
+        session_id: The unique import session ID.
+        current_user: The authenticated user (from JWT token).
+        limit: Number of movies to return (1-100, default 20).
+        offset: Index of the first movie to return (default 0).
+
+    Returns:
+        ImportSessionMoviesPage with the movies in the window.
+
+    Raises:
+        HTTPException: 404 if session not found or expired.
+    """
+    session = import_session_store.get_session(session_id, str(current_user.id))
+
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import session not found or expired",
+        )
+
+    return ImportSessionMoviesPage.model_construct(
+        items=session.movies[offset : offset + limit],
+        total=len(session.movies),
+        limit=limit,
+        offset=offset,
     )
 
 
@@ -490,9 +563,9 @@ async def add_import_movie(
             detail="Movie index out of range",
         )
 
-    movie_data = MatchedMovieItem(**session.movies[index])
+    movie_data = session.movies[index]
 
-    if movie_data.status != "pending":
+    if movie_data.status != MovieStatus.PENDING:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Movie has already been processed",
@@ -519,12 +592,13 @@ async def add_import_movie(
             logger.warning(f"Failed to fetch TMDB details for {tmdb_id}: {e}")
 
         # Create new movie with full TMDB data
+        genre_ids = movie_data.tmdb_match.genre_ids
         movie = Movie(
             tmdb_id=tmdb_id,
             title=movie_data.tmdb_match.title,
             year=movie_data.tmdb_match.year,
             poster_url=movie_data.tmdb_match.poster_url,
-            genre_ids=movie_data.tmdb_match.genre_ids,
+            genre_ids=list(genre_ids) if genre_ids else None,
             vote_average=movie_data.tmdb_match.vote_average,
             vote_count=movie_data.tmdb_match.vote_count,
             release_date=parse_release_date(movie_data.tmdb_match.release_date),
@@ -533,12 +607,11 @@ async def add_import_movie(
         )
         db.add(movie)
         await db.flush()
-        await db.refresh(movie)
     else:
         # Update existing movie if it's missing metadata
         needs_update = False
         if movie.genre_ids is None and movie_data.tmdb_match.genre_ids:
-            movie.genre_ids = movie_data.tmdb_match.genre_ids
+            movie.genre_ids = list(movie_data.tmdb_match.genre_ids)
             needs_update = True
         if movie.vote_average is None and movie_data.tmdb_match.vote_average is not None:
             movie.vote_average = movie_data.tmdb_match.vote_average
@@ -563,14 +636,13 @@ async def add_import_movie(
 
         if needs_update:
             await db.flush()
-            await db.refresh(movie)
 
     # Determine rated_at: use request value, fall back to watch_date, then now
     rated_at = to_naive_utc(request.rated_at)
     if rated_at is None and movie_data.parsed.watch_date:
         rated_at = to_naive_utc(movie_data.parsed.watch_date)
     if rated_at is None:
-        rated_at = datetime.utcnow()
+        rated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
     # Check if user already has a ranking for this movie (upsert pattern)
     existing_result = await db.execute(
@@ -586,7 +658,6 @@ async def add_import_movie(
         existing_ranking.rating = request.rating
         existing_ranking.rated_at = rated_at
         await db.flush()
-        await db.refresh(existing_ranking)
         ranking = existing_ranking
     else:
         # Create new ranking
@@ -598,10 +669,9 @@ async def add_import_movie(
         )
         db.add(ranking)
         await db.flush()
-        await db.refresh(ranking)
 
     # Update session state
-    session.movies[index]["status"] = "added"
+    movie_data.status = MovieStatus.ADDED
     session.added_count += 1
     session.current_index = index + 1
 
@@ -649,16 +719,16 @@ async def skip_import_movie(
             detail="Movie index out of range",
         )
 
-    movie_data = MatchedMovieItem(**session.movies[index])
+    movie = session.movies[index]
 
-    if movie_data.status != "pending":
+    if movie.status != MovieStatus.PENDING:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Movie has already been processed",
         )
 
     # Update session state
-    session.movies[index]["status"] = "skipped"
+    movie.status = MovieStatus.SKIPPED
     session.skipped_count += 1
     session.current_index = index + 1
 
@@ -711,24 +781,15 @@ async def update_import_movie_match(
             detail="Movie index out of range",
         )
 
-    # Update the movie's match in the session with full TMDB data
-    session.movies[index]["tmdb_match"] = {
-        "tmdb_id": request.tmdb_id,
-        "title": request.title,
-        "year": request.year,
-        "poster_url": request.poster_url,
-        "overview": request.overview,
-        "genre_ids": request.genre_ids,
-        "vote_average": request.vote_average,
-        "vote_count": request.vote_count,
-        "release_date": request.release_date,
-        "original_language": request.original_language,
-    }
-    session.movies[index]["confidence"] = 1.0  # User-selected
-    session.movies[index]["alternatives"] = []  # Clear alternatives
+    # Update the stored movie in place with full TMDB data
+    item = session.movies[index]
+    # The request body was validated on the way in; reuse it as-is
+    item.tmdb_match = TMDBMatchResult.model_construct(**request.model_dump())
+    item.confidence = 1.0  # User-selected
+    item.alternatives = []  # Clear alternatives
     # Keep status as 'pending' so user can still add/skip
 
-    return MatchedMovieItem(**session.movies[index])
+    return item
 
 
 @router.delete(
@@ -2,28 +2,71 @@
 
 import logging
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 
 from app.database import DbSession
 from app.dependencies import CurrentUser
 from app.models.movie import Movie
+from app.schemas._base import BASE_CONFIG
 from app.schemas.movie import (
     MovieCreate,
     MovieResponse,
     TMDBSearchResponse,
     TMDBSearchResult,
 )
+from app.services.cache import TTLCache
 from app.services.tmdb import (
     TMDBAPIError,
     TMDBRateLimitError,
     TMDBService,
     TMDBServiceError,
+    normalize_search_query,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["movies"])
 
+# Validates a list of TMDB service results (dataclasses) against the schema
+tmdb_search_results_adapter = TypeAdapter(
+    list[TMDBSearchResult], config=BASE_CONFIG
+)
+
+# Freshness is controlled by TMDBService's search_cache alone; this router
+# only keeps last known good responses, served when TMDB is rate limiting or
+# down.
+STALE_SEARCH_RESPONSE_TTL_SECONDS = 7 * 24 * 60 * 60
+STALE_SEARCH_RESPONSE_MAX_ENTRIES = 2048
+stale_search_response_cache: TTLCache[
+    tuple[str, int | None], TMDBSearchResponse
+] = TTLCache(
+    maxsize=STALE_SEARCH_RESPONSE_MAX_ENTRIES,
+    ttl_seconds=STALE_SEARCH_RESPONSE_TTL_SECONDS,
+)
+
+
+def get_stale_search_response(
+    cache_key: tuple[str, int | None],
+    q: str,
+    response: Response,
+) -> TMDBSearchResponse | None:
+    """Return the last known search response for a key, marked as stale.
+
+    Args:
+        cache_key: Normalized (query, year) cache key.
+        q: The caller's original query string.
+        response: Outgoing response, used to set the X-Cache header.
+
+    Returns:
+        The stale TMDBSearchResponse, or None if no copy is available.
+    """
+    stale = stale_search_response_cache.get(cache_key)
+    if stale is None:
+        return None
+    response.headers["X-Cache"] = "STALE"
+    return stale.model_copy(update={"query": q})
+
 
 @router.get(
     "/search/",
@@ -39,15 +82,21 @@ router = APIRouter(tags=["movies"])
 )
 async def search_tmdb_movies(
     current_user: CurrentUser,
+    response: Response,
     q: str = Query(..., min_length=1, max_length=200, description="Search query"),
     year: int | None = Query(None, ge=1888, le=2031, description="Filter by year"),
 ) -> TMDBSearchResponse:
     """Search for movies on The Movie Database (TMDB).
 
     Requires authentication. Searches TMDB for movies matching the query.
+    Result freshness is governed by TMDBService's search cache
+    (SEARCH_CACHE_TTL_SECONDS), so repeated searches skip TMDB.
+    If TMDB fails, the last known response for the same search is returned
+    with an ``X-Cache: STALE`` header instead of an error.
 
     Args:
         current_user: The authenticated user (from JWT token).
+        response: Outgoing response, used to flag stale results.
         q: Search query string (movie title).
         year: Optional year filter to narrow results.
 
@@ -56,50 +105,53 @@ async def search_tmdb_movies(
 
     Raises:
         HTTPException: 401 Unauthorized if not authenticated.
-        HTTPException: 503 Service Unavailable if TMDB rate limit exceeded.
-        HTTPException: 500 Internal Server Error for other TMDB errors.
+        HTTPException: 503 Service Unavailable if TMDB rate limit exceeded
+            and no stale copy is cached.
+        HTTPException: 500 Internal Server Error for other TMDB errors
+            when no stale copy is cached.
     """
+    cache_key = (normalize_search_query(q), year)
     try:
         async with TMDBService() as service:
             results = await service.search_movies(query=q, year=year)
 
-        # Convert to response schema with all metadata fields
-        search_results = [
-            TMDBSearchResult(
-                tmdb_id=result.tmdb_id,
-                title=result.title,
-                year=result.year,
-                poster_url=result.poster_url,
-                overview=result.overview,
-                genre_ids=result.genre_ids,
-                vote_average=result.vote_average,
-                vote_count=result.vote_count,
-                release_date=result.release_date,
-                original_language=result.original_language,
-            )
-            for result in results
-        ]
-
-        return TMDBSearchResponse(
+        # Convert to response schema with all metadata fields in one
+        # validation pass over the whole list
+        search_results = tmdb_search_results_adapter.validate_python(
+            results, from_attributes=True
+        )
+
+        search_response = TMDBSearchResponse(
             results=search_results,
             query=q,
             year=year,
         )
+        stale_search_response_cache.set(cache_key, search_response)
+        return search_response
 
     except TMDBRateLimitError as e:
         logger.warning(f"TMDB rate limit exceeded: {e}")
+        stale = get_stale_search_response(cache_key, q, response)
+        if stale is not None:
+            return stale
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="TMDB rate limit exceeded. Please try again later.",
         )
     except TMDBAPIError as e:
         logger.error(f"TMDB API error: {e}")
+        stale = get_stale_search_response(cache_key, q, response)
+        if stale is not None:
+            return stale
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to search TMDB. Please try again.",
         )
     except TMDBServiceError as e:
         logger.error(f"TMDB service error: {e}")
+        stale = get_stale_search_response(cache_key, q, response)
+        if stale is not None:
+            return stale
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="TMDB service unavailable. Please try again later.",
@@ -152,7 +204,7 @@ async def create_movie(
     )
 
     db.add(new_movie)
+    # The INSERT returns the generated id and timestamps, so no refresh needed
     await db.flush()
-    await db.refresh(new_movie)
 
     return new_movie
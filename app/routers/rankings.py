@@ -1,15 +1,20 @@
 """Rankings router for creating and listing user movie rankings."""
 
+import base64
+import binascii
+import hashlib
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Literal
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, HTTPException, Query, Response, status
-from sqlalchemy import func, select
-from sqlalchemy.orm import contains_eager, joinedload
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from sqlalchemy import asc, delete, desc, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import contains_eager, raiseload, selectinload
 
-from app.database import DbSession
+from app.database import DbSession, ReadDbSession
 from app.dependencies import CurrentUser
 from app.models.movie import Movie
 from app.models.ranking import Ranking
@@ -17,11 +22,31 @@ from app.schemas.ranking import (
     RankingCreate,
     RankingListResponse,
     RankingResponse,
-    RankingWithMovie,
+    ranking_with_movie_list_adapter,
 )
+from app.services.cache import TTLCache
 
 router = APIRouter(tags=["rankings"])
 
+# Movie IDs recently confirmed to exist. Movies are never deleted, so a
+# positive entry cannot go stale; the TTL only bounds memory churn.
+KNOWN_MOVIE_CACHE_TTL_SECONDS = 5 * 60
+KNOWN_MOVIE_CACHE_MAX_ENTRIES = 10_000
+known_movie_ids: TTLCache[UUID, bool] = TTLCache(
+    maxsize=KNOWN_MOVIE_CACHE_MAX_ENTRIES,
+    ttl_seconds=KNOWN_MOVIE_CACHE_TTL_SECONDS,
+)
+
+# list_rankings sort options: sort_by -> column, sort_order -> direction
+SORT_COLUMNS = {
+    "rated_at": Ranking.rated_at,
+    "rating": Ranking.rating,
+    "title": Movie.title,
+    "year": Movie.year,
+}
+MOVIE_SORT_FIELDS = frozenset({"title", "year"})
+SORT_ORDER_FUNCTIONS = {"asc": asc, "desc": desc}
+
 
 def to_naive_utc(dt: datetime | None) -> datetime | None:
     """Convert a datetime to naive UTC datetime for database storage."""
@@ -33,6 +58,65 @@ def to_naive_utc(dt: datetime | None) -> datetime | None:
     return dt
 
 
+def encode_ranking_cursor(rated_at: datetime, ranking_id: UUID) -> str:
+    """Encode a list_rankings keyset position as an opaque cursor string.
+
+    Args:
+        rated_at: rated_at of the last ranking on the current page.
+        ranking_id: ID of the last ranking on the current page.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = f"{rated_at.isoformat()}|{ranking_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_ranking_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_ranking_cursor.
+
+    Args:
+        cursor: Cursor string from a previous list_rankings response.
+
+    Returns:
+        Tuple of (rated_at, ranking_id) of the last ranking already seen.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded).decode()
+        rated_at_str, ranking_id_str = raw.split("|")
+        return datetime.fromisoformat(rated_at_str), UUID(ranking_id_str)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any.
+        etag: The current weak ETag, e.g. 'W/"abc123"'.
+
+    Returns:
+        True if the client's cached copy is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
 @router.post(
     "/",
     response_model=RankingResponse,
@@ -54,7 +138,8 @@ async def create_or_update_ranking(
     """Create or update a ranking for a movie.
 
     If the user has already ranked this movie, the rating is updated.
-    Otherwise, a new ranking is created.
+    Otherwise, a new ranking is created. Both cases are handled by a single
+    upsert on the (user_id, movie_id) unique constraint.
 
     Args:
         ranking_data: Ranking data containing movie_id and rating.
@@ -69,50 +154,52 @@ async def create_or_update_ranking(
         HTTPException: 401 Unauthorized if not authenticated.
         HTTPException: 404 Not Found if movie does not exist.
     """
-    # Check if movie exists
-    movie_result = await db.execute(
-        select(Movie).where(Movie.id == ranking_data.movie_id)
-    )
-    movie = movie_result.scalar_one_or_none()
-
-    if movie is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Movie not found",
+    # Check if movie exists (skipped when recently confirmed)
+    if known_movie_ids.get(ranking_data.movie_id) is None:
+        movie_result = await db.execute(
+            select(Movie.id).where(Movie.id == ranking_data.movie_id)
         )
+        if movie_result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Movie not found",
+            )
+        known_movie_ids.set(ranking_data.movie_id, True)
+
+    # Insert the ranking, or update it if the user already rated this movie,
+    # in a single INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement
+    insert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    new_id = uuid4()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rated_at = to_naive_utc(ranking_data.rated_at)
+
+    stmt = insert(Ranking).values(
+        id=new_id,
+        user_id=current_user.id,
+        movie_id=ranking_data.movie_id,
+        rating=ranking_data.rating,
+        rated_at=rated_at or now,
+    )
+    # Only overwrite rated_at on update if explicitly provided
+    update_values = {"rating": stmt.excluded.rating, "updated_at": now}
+    if rated_at is not None:
+        update_values["rated_at"] = stmt.excluded.rated_at
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Ranking.user_id, Ranking.movie_id],
+        set_=update_values,
+    ).returning(Ranking)
 
-    # Check if user already has a ranking for this movie
-    existing_result = await db.execute(
-        select(Ranking).where(
-            Ranking.user_id == current_user.id,
-            Ranking.movie_id == ranking_data.movie_id,
-        )
+    result = await db.execute(
+        stmt, execution_options={"populate_existing": True}
     )
-    existing_ranking = existing_result.scalar_one_or_none()
-
-    if existing_ranking is not None:
-        # Update existing ranking
-        existing_ranking.rating = ranking_data.rating
-        # Only update rated_at if explicitly provided
-        if ranking_data.rated_at is not None:
-            existing_ranking.rated_at = to_naive_utc(ranking_data.rated_at)
-        await db.flush()
-        await db.refresh(existing_ranking)
-        response.status_code = status.HTTP_200_OK
-        return existing_ranking
-    else:
-        # Create new ranking
-        new_ranking = Ranking(
-            user_id=current_user.id,
-            movie_id=ranking_data.movie_id,
-            rating=ranking_data.rating,
-            rated_at=to_naive_utc(ranking_data.rated_at) or datetime.utcnow(),
-        )
-        db.add(new_ranking)
-        await db.flush()
-        await db.refresh(new_ranking)
+    ranking = result.scalar_one()
+
+    # A freshly inserted row keeps the ID we generated
+    if ranking.id == new_id:
         response.status_code = status.HTTP_201_CREATED
-        return new_ranking
+    else:
+        response.status_code = status.HTTP_200_OK
+    return ranking
 
 
 @router.get(
@@ -121,14 +208,22 @@ async def create_or_update_ranking(
     summary="List user's rankings",
     responses={
         200: {"description": "Rankings retrieved successfully"},
+        304: {"description": "Client's cached page is still current"},
+        400: {"description": "Invalid cursor"},
         401: {"description": "Not authenticated"},
     },
 )
 async def list_rankings(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
-    db: DbSession,
+    db: ReadDbSession,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(
+        default=None,
+        description="next_cursor from a previous page (rated_at sort only)",
+    ),
     sort_by: Literal["rated_at", "rating", "title", "year"] = Query(
         default="rated_at",
         description="Field to sort by",
@@ -137,70 +232,134 @@ async def list_rankings(
         default="desc",
         description="Sort order (asc or desc)",
     ),
-) -> RankingListResponse:
+) -> RankingListResponse | Response:
     """List all movies the authenticated user has ranked.
 
-    Returns paginated results with configurable sorting.
+    Returns paginated results with configurable sorting. When sorting by
+    rated_at, each page includes a next_cursor; passing it back as cursor
+    seeks directly past the previous page instead of scanning offset rows.
+
+    Pages carry a weak ETag derived from the user's ranking count and the
+    latest update to those rankings or their movies; a matching
+    If-None-Match gets an empty 304 response.
 
     Args:
+        request: Incoming request, read for If-None-Match.
+        response: Outgoing response, used to set the ETag header.
         current_user: The authenticated user (from JWT token).
-        db: Async database session.
+        db: Async database session (read replica when configured).
         limit: Number of results to return (1-100, default 20).
-        offset: Number of results to skip (default 0).
+        offset: Number of results to skip (default 0, ignored with cursor).
+        cursor: Keyset cursor from a previous page's next_cursor.
         sort_by: Field to sort by (rated_at, rating, title, year).
         sort_order: Sort order (asc or desc).
 
     Returns:
-        Paginated list of rankings with embedded movie details.
+        Paginated list of rankings with embedded movie details, or an empty
+        304 response if the client's copy is current.
 
     Raises:
+        HTTPException: 400 if the cursor is invalid or sort_by is not rated_at.
         HTTPException: 401 Unauthorized if not authenticated.
     """
-    # Get total count of user's rankings
-    count_result = await db.execute(
-        select(func.count()).where(Ranking.user_id == current_user.id)
+    position: tuple[datetime, UUID] | None = None
+    if cursor is not None:
+        if sort_by != "rated_at":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination requires sort_by=rated_at",
+            )
+        position = decode_ranking_cursor(cursor)
+        offset = 0
+
+    # Any change to the user's rankings bumps the count or max(updated_at),
+    # and metadata backfills on a ranked movie (e.g. from an import) bump
+    # max(Movie.updated_at), so together with the page parameters they
+    # identify this page's content
+    version_result = await db.execute(
+        select(
+            func.count(),
+            func.max(Ranking.updated_at),
+            func.max(Movie.updated_at),
+        )
+        .join(Ranking.movie)
+        .where(Ranking.user_id == current_user.id)
+    )
+    total, last_updated, movies_updated = version_result.one()
+    etag_key = (
+        f"{current_user.id}:{total}:{last_updated}:{movies_updated}:"
+        f"{limit}:{offset}:{cursor}:{sort_by}:{sort_order}"
     )
-    total = count_result.scalar_one()
+    etag = f'W/"{hashlib.blake2b(etag_key.encode(), digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
 
-    # Determine sort column and whether we need explicit join
-    sort_by_movie = sort_by in ("title", "year")
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
 
-    if sort_by_movie:
+    # Sorting by movie fields needs an explicit join
+    if sort_by in MOVIE_SORT_FIELDS:
         # Use explicit join for sorting by movie fields
         query = (
             select(Ranking)
             .join(Ranking.movie)
-            .options(contains_eager(Ranking.movie))
+            .options(
+                contains_eager(Ranking.movie).raiseload(Movie.rankings),
+                raiseload(Ranking.user),
+            )
             .where(Ranking.user_id == current_user.id)
         )
-        sort_column = Movie.title if sort_by == "title" else Movie.year
     else:
-        # Use joinedload for ranking fields
+        # Sorting by ranking fields can use idx_rankings_user_rated_at, so
+        # load movies with a separate IN query instead of joining them
         query = (
             select(Ranking)
-            .options(joinedload(Ranking.movie))
+            .options(
+                selectinload(Ranking.movie).raiseload(Movie.rankings),
+                raiseload(Ranking.user),
+            )
             .where(Ranking.user_id == current_user.id)
         )
-        sort_column = Ranking.rating if sort_by == "rating" else Ranking.rated_at
 
-    # Apply sort order
-    if sort_order == "asc":
-        query = query.order_by(sort_column.asc())
-    else:
-        query = query.order_by(sort_column.desc())
-
-    # Execute with pagination
-    rankings_result = await db.execute(query.limit(limit).offset(offset))
-    rankings = rankings_result.scalars().unique().all()
+    # Apply sort order; movies without a year always sort last so pages
+    # stay consistent in both directions
+    order_fn = SORT_ORDER_FUNCTIONS[sort_order]
+    order_clause = order_fn(SORT_COLUMNS[sort_by])
+    if sort_by == "year":
+        order_clause = order_clause.nulls_last()
+    query = query.order_by(order_clause)
+    if sort_by == "rated_at":
+        # Tie-break on id so (rated_at, id) is a total order for the cursor
+        query = query.order_by(order_fn(Ranking.id))
+
+    if position is not None:
+        key = tuple_(Ranking.rated_at, Ranking.id)
+        after_cursor = key < position if sort_order == "desc" else key > position
+        query = query.where(after_cursor)
+
+    # Execute with pagination, fetching one extra row to detect a next page
+    rankings_result = await db.execute(query.limit(limit + 1).offset(offset))
+    rankings = rankings_result.scalars().all()
+    has_more = len(rankings) > limit
+    rankings = rankings[:limit]
 
     # Convert to response schema
-    items = [RankingWithMovie.model_validate(ranking) for ranking in rankings]
+    items = ranking_with_movie_list_adapter.validate_python(
+        rankings, from_attributes=True
+    )
+
+    next_cursor = None
+    if has_more and sort_by == "rated_at":
+        last = rankings[-1]
+        next_cursor = encode_ranking_cursor(last.rated_at, last.id)
 
-    return RankingListResponse(
+    # Items are already validated, so skip re-validating the envelope
+    return RankingListResponse.model_construct(
         items=items,
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -271,22 +430,24 @@ async def delete_ranking(
         HTTPException: 403 if ranking belongs to another user.
         HTTPException: 404 if ranking not found.
     """
-    # Find the ranking
-    result = await db.execute(select(Ranking).where(Ranking.id == ranking_id))
-    ranking = result.scalar_one_or_none()
+    # Delete in one statement when the ranking exists and is owned by the user
+    result = await db.execute(
+        delete(Ranking)
+        .where(Ranking.id == ranking_id, Ranking.user_id == current_user.id)
+        .returning(Ranking.id)
+    )
+    if result.scalar_one_or_none() is not None:
+        return
 
-    if ranking is None:
+    # Nothing deleted: look the ranking up only to pick 404 vs 403
+    existing = await db.execute(select(Ranking.id).where(Ranking.id == ranking_id))
+    if existing.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Ranking not found",
         )
 
-    # Check ownership
-    if ranking.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this ranking",
-        )
-
-    await db.delete(ranking)
-    await db.flush()
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Not authorized to delete this ranking",
+    )
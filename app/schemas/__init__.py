@@ -5,8 +5,10 @@ from app.schemas.import_amazon import (
     ImportMovieAddRequest,
     ImportMovieMatchRequest,
     ImportSessionDetailResponse,
+    ImportSessionMoviesPage,
     ImportSessionResponse,
     MatchedMovieItem,
+    MovieStatus,
     ParsedMovieItem,
     TMDBMatchResult,
 )
@@ -42,11 +44,13 @@ __all__ = [
     "ImportMovieAddRequest",
     "ImportMovieMatchRequest",
     "ImportSessionDetailResponse",
+    "ImportSessionMoviesPage",
     "ImportSessionResponse",
     "MatchedMovieItem",
     "MovieBrief",
     "MovieCreate",
     "MovieResponse",
+    "MovieStatus",
     "ParsedMovieItem",
     "RankingCreate",
     "RankingListResponse",
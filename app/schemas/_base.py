@@ -0,0 +1,23 @@
+"""Shared Pydantic configuration for API schemas.
+
+Models defer building their validators and serializers until first use, so
+importing the schema package stays cheap and models a worker never touches
+are never compiled. Response-only schemas are additionally frozen: they are
+built once per row or request and never modified afterwards (use
+``model_copy(update=...)`` to derive a changed copy). Request bodies reject
+unknown fields, so client typos fail loudly instead of being dropped.
+"""
+
+from pydantic import ConfigDict
+
+BASE_CONFIG = ConfigDict(defer_build=True)
+
+ORM_CONFIG = ConfigDict(defer_build=True, from_attributes=True)
+
+INPUT_CONFIG = ConfigDict(defer_build=True, extra="forbid")
+
+RESPONSE_CONFIG = ConfigDict(defer_build=True, frozen=True, extra="ignore")
+
+ORM_RESPONSE_CONFIG = ConfigDict(
+    defer_build=True, from_attributes=True, frozen=True, extra="ignore"
+)
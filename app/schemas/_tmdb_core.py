@@ -0,0 +1,43 @@
+"""Shared TMDB movie schema.
+
+TMDB search results, import match results and manual match requests all
+carry the same movie metadata, so they share one model (and one compiled
+validator) instead of declaring the fields three times.
+"""
+
+from pydantic import BaseModel, Field
+
+from app.schemas._base import ORM_RESPONSE_CONFIG
+
+
+class TMDBMovieCore(BaseModel):
+    """Movie metadata as returned by a TMDB search.
+
+    Attributes:
+        tmdb_id: TMDB movie ID.
+        title: Movie title.
+        year: Release year extracted from release_date (optional).
+        poster_url: Full URL to movie poster thumbnail (optional).
+        overview: Movie synopsis/description (optional).
+        genre_ids: Tuple of TMDB genre IDs (optional).
+        vote_average: TMDB user rating 0.0-10.0 (optional).
+        vote_count: Number of TMDB votes (optional).
+        release_date: Full release date string YYYY-MM-DD (optional).
+        original_language: ISO 639-1 language code (optional).
+    """
+
+    model_config = ORM_RESPONSE_CONFIG
+
+    tmdb_id: int = Field(..., description="TMDB movie ID")
+    title: str = Field(..., description="Movie title")
+    year: int | None = Field(None, description="Release year")
+    poster_url: str | None = Field(None, description="URL to movie poster")
+    overview: str | None = Field(None, description="Movie synopsis")
+    genre_ids: tuple[int, ...] | None = Field(
+        None,
+        description="TMDB genre IDs",
+    )
+    vote_average: float | None = Field(None, description="TMDB user rating")
+    vote_count: int | None = Field(None, description="Number of TMDB votes")
+    release_date: str | None = Field(None, description="Full release date (YYYY-MM-DD)")
+    original_language: str | None = Field(None, description="ISO 639-1 language code")
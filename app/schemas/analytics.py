@@ -1,10 +1,11 @@
 """Analytics schemas for activity and insights responses."""
 
 from datetime import date as date_type
-from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas._base import RESPONSE_CONFIG
+
 
 class ActivityDay(BaseModel):
     """Schema for a single day's activity.
@@ -14,6 +15,8 @@ class ActivityDay(BaseModel):
         count: Number of movies rated on this day.
     """
 
+    model_config = RESPONSE_CONFIG
+
     date: date_type = Field(..., description="Date of activity")
     count: int = Field(..., ge=0, description="Number of movies rated")
 
@@ -29,7 +32,9 @@ class ActivityResponse(BaseModel):
         end_date: End of the date range.
     """
 
-    activity: List[ActivityDay] = Field(
+    model_config = RESPONSE_CONFIG
+
+    activity: list[ActivityDay] = Field(
         ..., description="List of days with activity"
     )
     start_date: date_type = Field(..., description="Start of date range")
@@ -46,6 +51,8 @@ class GenreStats(BaseModel):
         average_rating: Average user rating for movies in this genre.
     """
 
+    model_config = RESPONSE_CONFIG
+
     genre_id: int = Field(..., description="TMDB genre ID")
     genre_name: str = Field(..., description="Genre name")
     count: int = Field(..., ge=0, description="Number of movies rated")
@@ -62,7 +69,9 @@ class GenreResponse(BaseModel):
         total_movies: Total number of rated movies in the period.
     """
 
-    genres: List[GenreStats] = Field(
+    model_config = RESPONSE_CONFIG
+
+    genres: list[GenreStats] = Field(
         ..., description="Genre statistics sorted by count"
     )
     total_movies: int = Field(..., ge=0, description="Total movies rated")
@@ -82,6 +91,8 @@ class StatsResponse(BaseModel):
         top_genre: The user's most-rated genre name, or None if no ratings.
     """
 
+    model_config = RESPONSE_CONFIG
+
     total_movies: int = Field(..., ge=0, description="Total movies rated by user")
     total_watch_time_minutes: int = Field(
         ..., ge=0, description="Total runtime of all rated movies in minutes"
@@ -93,7 +104,7 @@ class StatsResponse(BaseModel):
     longest_streak: int = Field(
         ..., ge=0, description="Longest streak of consecutive days ever"
     )
-    top_genre: Optional[str] = Field(
+    top_genre: str | None = Field(
         None, description="User's most-rated genre name, or None if no ratings"
     )
 
@@ -106,6 +117,8 @@ class RatingCount(BaseModel):
         count: Number of movies with this rating.
     """
 
+    model_config = RESPONSE_CONFIG
+
     rating: int = Field(..., ge=1, le=5, description="Rating value (1-5)")
     count: int = Field(..., ge=0, description="Number of movies with this rating")
 
@@ -119,11 +132,15 @@ class RatingDistributionResponse(BaseModel):
     All five rating values are always included, even if count is 0.
 
     Attributes:
-        distribution: List of counts for each rating value (1-5).
+        distribution: Counts for each rating value, ordered 1 through 5.
         total: Total number of rated movies.
     """
 
-    distribution: List[RatingCount] = Field(
+    model_config = RESPONSE_CONFIG
+
+    distribution: tuple[
+        RatingCount, RatingCount, RatingCount, RatingCount, RatingCount
+    ] = Field(
         ..., description="Counts for each rating value 1-5"
     )
     total: int = Field(..., ge=0, description="Total rated movies")
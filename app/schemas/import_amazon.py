@@ -5,9 +5,12 @@ watch history from Amazon Prime Video CSV exports.
 """
 
 from datetime import datetime
-from typing import Literal
+from enum import StrEnum
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
+
+from app.schemas._base import BASE_CONFIG, INPUT_CONFIG
+from app.schemas._tmdb_core import TMDBMovieCore
 
 
 class ParsedMovieItem(BaseModel):
@@ -22,42 +25,23 @@ class ParsedMovieItem(BaseModel):
         prime_image_url: Amazon Prime poster/thumbnail URL (optional fallback if TMDB fails).
     """
 
+    model_config = BASE_CONFIG
+
     title: str
     watch_date: datetime | None = None
     prime_image_url: str | None = None
 
 
-class TMDBMatchResult(BaseModel):
-    """TMDB search result for matching against parsed movies.
-
-    Contains the essential fields from TMDB needed to display
-    movie information during the import review flow.
+# TMDB match for a parsed movie, shown during the import review flow
+TMDBMatchResult = TMDBMovieCore
 
-    Attributes:
-        tmdb_id: The movie's ID in TMDB.
-        title: Movie title from TMDB.
-        year: Release year (optional).
-        poster_url: Full URL to poster thumbnail (optional).
-        overview: Movie synopsis/description (optional).
-        genre_ids: List of TMDB genre IDs (optional).
-        vote_average: TMDB user rating 0.0-10.0 (optional).
-        vote_count: Number of TMDB votes (optional).
-        release_date: Full release date string YYYY-MM-DD (optional).
-        original_language: ISO 639-1 language code (optional).
-    """
 
-    model_config = ConfigDict(from_attributes=True)
+class MovieStatus(StrEnum):
+    """Status of a movie in the import review workflow."""
 
-    tmdb_id: int
-    title: str
-    year: int | None = None
-    poster_url: str | None = None
-    overview: str | None = None
-    genre_ids: list[int] | None = None
-    vote_average: float | None = None
-    vote_count: int | None = None
-    release_date: str | None = None
-    original_language: str | None = None
+    PENDING = "pending"
+    ADDED = "added"
+    SKIPPED = "skipped"
 
 
 class MatchedMovieItem(BaseModel):
@@ -74,11 +58,13 @@ class MatchedMovieItem(BaseModel):
         status: Current status in the import workflow.
     """
 
+    model_config = BASE_CONFIG
+
     parsed: ParsedMovieItem
     tmdb_match: TMDBMatchResult | None = None
     confidence: float = Field(default=0.0, ge=0.0, le=1.0)
     alternatives: list[TMDBMatchResult] = Field(default_factory=list)
-    status: Literal["pending", "added", "skipped"] = "pending"
+    status: MovieStatus = MovieStatus.PENDING
 
 
 class ImportSessionResponse(BaseModel):
@@ -107,6 +93,8 @@ class ImportSessionResponse(BaseModel):
         movies: List of matched movies for the review flow.
     """
 
+    model_config = BASE_CONFIG
+
     session_id: str
     total_entries: int
     movies_found: int
@@ -138,16 +126,42 @@ class ImportSessionDetailResponse(BaseModel):
         added_count: Number of movies added to rankings so far.
         skipped_count: Number of movies skipped so far.
         remaining_count: Number of movies still pending review.
-        movies: List of all movies with their current statuses.
+        movies: List of all movies with their current statuses (empty when
+            requested with include_movies=false).
     """
 
+    model_config = BASE_CONFIG
+
     session_id: str
     current_index: int
     total_movies: int
     added_count: int
     skipped_count: int
     remaining_count: int
-    movies: list[MatchedMovieItem]
+    movies: list[MatchedMovieItem] = Field(default_factory=list)
+
+
+class ImportSessionMoviesPage(BaseModel):
+    """A window of movies from an import session.
+
+    RESPONSE SHAPE: { items: [...], total: N, limit: N, offset: N }
+
+    Lets clients page through a large session instead of fetching every
+    matched movie on each request.
+
+    Attributes:
+        items: Movies in the requested window, in review-queue order.
+        total: Total number of movies in the session.
+        limit: Number of movies requested.
+        offset: Index of the first movie in the window.
+    """
+
+    model_config = BASE_CONFIG
+
+    items: list[MatchedMovieItem]
+    total: int
+    limit: int
+    offset: int
 
 
 class ImportMovieAddRequest(BaseModel):
@@ -158,6 +172,8 @@ class ImportMovieAddRequest(BaseModel):
         rated_at: Optional date to use as rated_at (defaults to watch_date from CSV).
     """
 
+    model_config = INPUT_CONFIG
+
     rating: int = Field(..., ge=1, le=5)
     rated_at: datetime | None = None
 
@@ -177,37 +193,19 @@ class ImportCompletionResponse(BaseModel):
         unmatched_titles: List of movie titles that could not be matched to TMDB.
     """
 
+    model_config = BASE_CONFIG
+
     movies_added: int
     movies_skipped: int
     unmatched_titles: list[str]
 
 
-class ImportMovieMatchRequest(BaseModel):
+class ImportMovieMatchRequest(TMDBMovieCore):
     """Request to update a movie's TMDB match in an import session.
 
     Used when a user manually selects a different movie from search results.
     Sets the match with 1.0 confidence (user-selected) and clears alternatives.
-
-    Attributes:
-        tmdb_id: The TMDB ID of the selected movie.
-        title: Movie title from TMDB.
-        year: Release year (optional).
-        poster_url: Full URL to poster thumbnail (optional).
-        overview: Movie synopsis/description (optional).
-        genre_ids: List of TMDB genre IDs (optional).
-        vote_average: TMDB user rating 0.0-10.0 (optional).
-        vote_count: Number of TMDB votes (optional).
-        release_date: Full release date string YYYY-MM-DD (optional).
-        original_language: ISO 639-1 language code (optional).
+    Carries the same fields as TMDBMovieCore.
     """
 
-    tmdb_id: int = Field(..., description="The TMDB ID of the selected movie")
-    title: str = Field(..., description="Movie title from TMDB")
-    year: int | None = Field(None, description="Release year")
-    poster_url: str | None = Field(None, description="Full URL to poster thumbnail")
-    overview: str | None = Field(None, description="Movie synopsis/description")
-    genre_ids: list[int] | None = Field(None, description="List of TMDB genre IDs")
-    vote_average: float | None = Field(None, description="TMDB user rating 0.0-10.0")
-    vote_count: int | None = Field(None, description="Number of TMDB votes")
-    release_date: str | None = Field(None, description="Full release date YYYY-MM-DD")
-    original_language: str | None = Field(None, description="ISO 639-1 language code")
+    model_config = INPUT_CONFIG
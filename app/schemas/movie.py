@@ -1,10 +1,17 @@
 """Movie schemas for request/response validation."""
 
 from datetime import date, datetime
-from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
+
+from app.schemas._base import (
+    BASE_CONFIG,
+    INPUT_CONFIG,
+    ORM_RESPONSE_CONFIG,
+    RESPONSE_CONFIG,
+)
+from app.schemas._tmdb_core import TMDBMovieCore
 
 
 class MovieCreate(BaseModel):
@@ -23,28 +30,30 @@ class MovieCreate(BaseModel):
         runtime: Movie length in minutes (optional).
     """
 
+    model_config = INPUT_CONFIG
+
     title: str = Field(..., min_length=1, max_length=500)
-    year: Optional[int] = Field(None, ge=1888, le=2031)
-    tmdb_id: Optional[int] = Field(None, description="TMDB movie ID")
-    poster_url: Optional[str] = Field(
+    year: int | None = Field(None, ge=1888, le=2031)
+    tmdb_id: int | None = Field(None, description="TMDB movie ID")
+    poster_url: str | None = Field(
         None, max_length=500, description="URL to movie poster image"
     )
-    genre_ids: Optional[list[int]] = Field(
+    genre_ids: list[int] | None = Field(
         None, description="List of TMDB genre IDs"
     )
-    vote_average: Optional[float] = Field(
+    vote_average: float | None = Field(
         None, ge=0.0, le=10.0, description="TMDB user rating"
     )
-    vote_count: Optional[int] = Field(
+    vote_count: int | None = Field(
         None, ge=0, description="Number of TMDB votes"
     )
-    release_date: Optional[date] = Field(
+    release_date: date | None = Field(
         None, description="Full release date"
     )
-    original_language: Optional[str] = Field(
+    original_language: str | None = Field(
         None, max_length=10, description="ISO 639-1 language code"
     )
-    runtime: Optional[int] = Field(
+    runtime: int | None = Field(
         None, ge=0, description="Movie length in minutes"
     )
 
@@ -67,19 +76,19 @@ class MovieResponse(BaseModel):
         created_at: Record creation timestamp.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_RESPONSE_CONFIG
 
     id: UUID
     title: str
-    year: Optional[int]
-    tmdb_id: Optional[int]
-    poster_url: Optional[str]
-    genre_ids: Optional[list[int]]
-    vote_average: Optional[float]
-    vote_count: Optional[int]
-    release_date: Optional[date]
-    original_language: Optional[str]
-    runtime: Optional[int]
+    year: int | None
+    tmdb_id: int | None
+    poster_url: str | None
+    genre_ids: list[int] | None
+    vote_average: float | None
+    vote_count: int | None
+    release_date: date | None
+    original_language: str | None
+    runtime: int | None
     created_at: datetime
 
 
@@ -94,41 +103,17 @@ class MovieBrief(BaseModel):
         genre_ids: List of TMDB genre IDs (optional).
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_RESPONSE_CONFIG
 
     id: UUID
     title: str
-    year: Optional[int]
-    poster_url: Optional[str]
-    genre_ids: Optional[list[int]]
-
-
-class TMDBSearchResult(BaseModel):
-    """Schema for a single TMDB movie search result.
+    year: int | None
+    poster_url: str | None
+    genre_ids: list[int] | None
 
-    Attributes:
-        tmdb_id: TMDB movie ID.
-        title: Movie title.
-        year: Release year extracted from release_date (optional).
-        poster_url: Full URL to movie poster thumbnail (optional).
-        overview: Movie synopsis/description (optional).
-        genre_ids: List of TMDB genre IDs (optional).
-        vote_average: TMDB user rating 0.0-10.0 (optional).
-        vote_count: Number of TMDB votes (optional).
-        release_date: Full release date string (optional).
-        original_language: ISO 639-1 language code (optional).
-    """
 
-    tmdb_id: int = Field(..., description="TMDB movie ID")
-    title: str = Field(..., description="Movie title")
-    year: Optional[int] = Field(None, description="Release year")
-    poster_url: Optional[str] = Field(None, description="URL to movie poster")
-    overview: Optional[str] = Field(None, description="Movie synopsis")
-    genre_ids: Optional[list[int]] = Field(None, description="List of TMDB genre IDs")
-    vote_average: Optional[float] = Field(None, description="TMDB user rating")
-    vote_count: Optional[int] = Field(None, description="Number of TMDB votes")
-    release_date: Optional[str] = Field(None, description="Full release date (YYYY-MM-DD)")
-    original_language: Optional[str] = Field(None, description="ISO 639-1 language code")
+# A single TMDB movie search result
+TMDBSearchResult = TMDBMovieCore
 
 
 class TMDBSearchResponse(BaseModel):
@@ -140,11 +125,13 @@ class TMDBSearchResponse(BaseModel):
         year: The year filter used (if any).
     """
 
+    model_config = RESPONSE_CONFIG
+
     results: list[TMDBSearchResult] = Field(
         ..., description="List of matching movies"
     )
     query: str = Field(..., description="The search query")
-    year: Optional[int] = Field(None, description="Year filter used")
+    year: int | None = Field(None, description="Year filter used")
 
 
 class TMDBMovieDetails(BaseModel):
@@ -157,8 +144,10 @@ class TMDBMovieDetails(BaseModel):
         runtime: Movie length in minutes (optional).
     """
 
-    tmdb_id: int = Field(..., description="TMDB movie ID")
-    runtime: Optional[int] = Field(None, description="Movie length in minutes")
+    model_config = BASE_CONFIG
+
+    tmdb_id: int
+    runtime: int | None = None
 
 
 class GenreResponse(BaseModel):
@@ -169,7 +158,7 @@ class GenreResponse(BaseModel):
         name: Genre name.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_RESPONSE_CONFIG
 
     id: int
     name: str
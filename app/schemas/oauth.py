@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field
 
+from app.schemas._base import BASE_CONFIG
+
 
 class GoogleAuthUrlResponse(BaseModel):
     """Schema for Google OAuth authorization URL response.
@@ -14,6 +16,8 @@ class GoogleAuthUrlResponse(BaseModel):
         authorization_url: Full Google OAuth URL with state parameter.
     """
 
+    model_config = BASE_CONFIG
+
     authorization_url: str = Field(
         ...,
         description="Full Google OAuth authorization URL to redirect user to",
@@ -28,10 +32,10 @@ class GoogleCallbackError(BaseModel):
         error_description: Human-readable error description.
     """
 
-    error: str = Field(..., description="Error code")
-    error_description: str | None = Field(
-        None, description="Human-readable error description"
-    )
+    model_config = BASE_CONFIG
+
+    error: str
+    error_description: str | None = None
 
 
 class AccountLinkingResponse(BaseModel):
@@ -46,8 +50,8 @@ class AccountLinkingResponse(BaseModel):
         message: Instructions for the user.
     """
 
-    requires_linking: bool = Field(
-        True, description="Indicates that account linking is required"
-    )
-    email: str = Field(..., description="Email address of the existing account")
-    message: str = Field(..., description="User-friendly message about linking")
+    model_config = BASE_CONFIG
+
+    requires_linking: bool = True
+    email: str
+    message: str
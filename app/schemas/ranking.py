@@ -1,11 +1,16 @@
 """Ranking schemas for request/response validation."""
 
 from datetime import datetime
-from typing import List
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from app.schemas._base import (
+    BASE_CONFIG,
+    INPUT_CONFIG,
+    ORM_RESPONSE_CONFIG,
+    RESPONSE_CONFIG,
+)
 from app.schemas.movie import MovieBrief
 
 
@@ -18,6 +23,8 @@ class RankingCreate(BaseModel):
         rated_at: Optional date when the movie was rated (defaults to now).
     """
 
+    model_config = INPUT_CONFIG
+
     movie_id: UUID
     rating: int = Field(..., ge=1, le=5)
     rated_at: datetime | None = None
@@ -35,7 +42,7 @@ class RankingResponse(BaseModel):
         updated_at: Last update timestamp.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_RESPONSE_CONFIG
 
     id: UUID
     movie_id: UUID
@@ -59,7 +66,7 @@ class RankingWithMovie(BaseModel):
         movie: Embedded movie details.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_RESPONSE_CONFIG
 
     id: UUID
     rating: int
@@ -77,9 +84,21 @@ class RankingListResponse(BaseModel):
         total: Total number of rankings for this user.
         limit: Number of results requested.
         offset: Number of results skipped.
+        next_cursor: Cursor for the next page when sorting by rated_at,
+            or None on the last page.
     """
 
-    items: List[RankingWithMovie]
+    model_config = RESPONSE_CONFIG
+
+    items: list[RankingWithMovie]
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
+
+
+# Validates a page of Ranking ORM objects (with loaded movies) in one pass.
+# Built lazily; the app lifespan warms it up before serving traffic.
+ranking_with_movie_list_adapter = TypeAdapter(
+    list[RankingWithMovie], config=BASE_CONFIG
+)
@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel
 
+from app.schemas._base import BASE_CONFIG
+
 
 class Token(BaseModel):
     """OAuth2 token response schema.
@@ -11,5 +13,7 @@ class Token(BaseModel):
         token_type: The token type (always "bearer").
     """
 
+    model_config = BASE_CONFIG
+
     access_token: str
     token_type: str = "bearer"
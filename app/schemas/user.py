@@ -1,10 +1,40 @@
 """User schemas for request/response validation."""
 
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, Field, StringConstraints
+
+from app.schemas._base import INPUT_CONFIG, ORM_RESPONSE_CONFIG
+
+# Deliberately stricter than RFC 5322: one @, a dotted domain and an
+# alphabetic TLD. Compiled once by pydantic-core and shared by every field
+# typed as EmailAddress.
+EMAIL_PATTERN = r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$"
+
+
+def normalize_email_domain(email: str) -> str:
+    """Lowercase the domain part of an email address.
+
+    Domains are case-insensitive, so this keeps "a@Example.com" and
+    "a@example.com" from registering as separate accounts.
+
+    Args:
+        email: An email address that already matched EMAIL_PATTERN.
+
+    Returns:
+        The address with its domain lowercased.
+    """
+    local, _, domain = email.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+EmailAddress = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, max_length=254, pattern=EMAIL_PATTERN),
+    AfterValidator(normalize_email_domain),
+]
 
 
 class UserCreate(BaseModel):
@@ -15,7 +45,9 @@ class UserCreate(BaseModel):
         password: Password with minimum 8 characters.
     """
 
-    email: EmailStr
+    model_config = INPUT_CONFIG
+
+    email: EmailAddress
     password: str = Field(..., min_length=8)
 
 
@@ -28,7 +60,7 @@ class UserResponse(BaseModel):
         created_at: Timestamp when the account was created.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_RESPONSE_CONFIG
 
     id: UUID
     email: str
@@ -52,7 +84,7 @@ class UserProfileResponse(BaseModel):
         created_at: Timestamp when the account was created.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_RESPONSE_CONFIG
 
     id: UUID
     email: str
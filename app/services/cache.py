@@ -0,0 +1,80 @@
+"""In-process caching helpers shared across requests.
+
+The API runs as a single long-lived process (uvicorn) or as a warm Lambda
+container, so module-level caches survive between requests and users. These
+caches are best-effort: entries are lost on restart and are not shared
+between processes.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Expiry is checked lazily on read, and the least recently used entry is
+    evicted once ``maxsize`` is reached.
+
+    Example:
+        cache: TTLCache[str, int] = TTLCache(maxsize=100, ttl_seconds=60)
+        cache.set("answer", 42)
+        cache.get("answer")  # 42 until the entry is 60 seconds old
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in the cache.
+            ttl_seconds: Seconds an entry stays valid after being stored.
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+        """
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries (including expired ones)."""
+        return len(self._data)
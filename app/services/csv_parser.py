@@ -9,17 +9,19 @@ Amazon Prime CSV Format:
     Episode Global Title Identifier,Path,Episode Path,Image URL
 """
 
+import codecs
 import csv
 import io
 import logging
+import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import BinaryIO
+from typing import BinaryIO, TextIO
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedMovie:
     """Internal representation of a movie parsed from CSV.
 
@@ -36,7 +38,7 @@ class ParsedMovie:
     prime_image_url: str | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParseResult:
     """Result of parsing an Amazon Prime CSV file.
 
@@ -55,6 +57,56 @@ class ParseResult:
     parse_errors: int
 
 
+# Date shapes seen in CSV exports, matched in one pass instead of trying
+# strptime format by format:
+#   2024-01-15, 2024-01-15T10:30:00, 2024-01-15T10:30:00Z, 2024-01-15 10:30:00
+#   01/15/2024 (US) or 15/01/2024 (day first)
+DATE_PATTERN = re.compile(
+    r"(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})"
+    r"(?:(?:T(?P<t_hour>\d{1,2}):(?P<t_minute>\d{1,2}):(?P<t_second>\d{1,2})Z?)"
+    r"|(?: (?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2})))?"
+    r"|(?P<slash_first>\d{1,2})/(?P<slash_second>\d{1,2})/(?P<slash_year>\d{4})"
+)
+
+
+def _datetime_from_match(match: re.Match[str]) -> datetime | None:
+    """Build a datetime from a DATE_PATTERN match.
+
+    Args:
+        match: A full match of DATE_PATTERN.
+
+    Returns:
+        The parsed datetime, or None if the components are out of range
+        (e.g. February 30th).
+    """
+    if match["iso_year"] is not None:
+        hour = match["t_hour"] or match["hour"] or 0
+        minute = match["t_minute"] or match["minute"] or 0
+        second = match["t_second"] or match["second"] or 0
+        try:
+            return datetime(
+                int(match["iso_year"]),
+                int(match["iso_month"]),
+                int(match["iso_day"]),
+                int(hour),
+                int(minute),
+                int(second),
+            )
+        except ValueError:
+            return None
+
+    # Slash dates are read month-first, then day-first if that is invalid
+    slash_first = int(match["slash_first"])
+    slash_second = int(match["slash_second"])
+    year = int(match["slash_year"])
+    for month, day in ((slash_first, slash_second), (slash_second, slash_first)):
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            continue
+    return None
+
+
 def parse_date(date_str: str | None) -> tuple[datetime | None, int | None]:
     """Parse date string in various formats.
 
@@ -73,22 +125,11 @@ def parse_date(date_str: str | None) -> tuple[datetime | None, int | None]:
 
     date_str = date_str.strip()
 
-    # Try various formats commonly used in CSV exports
-    formats = [
-        "%Y-%m-%d",  # 2024-01-15
-        "%m/%d/%Y",  # 01/15/2024
-        "%d/%m/%Y",  # 15/01/2024
-        "%Y-%m-%dT%H:%M:%S",  # ISO format without timezone
-        "%Y-%m-%dT%H:%M:%SZ",  # ISO format with Z
-        "%Y-%m-%d %H:%M:%S",  # 2024-01-15 10:30:00
-    ]
-
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(date_str, fmt)
+    match = DATE_PATTERN.fullmatch(date_str)
+    if match is not None:
+        dt = _datetime_from_match(match)
+        if dt is not None:
             return dt, dt.year
-        except ValueError:
-            continue
 
     # Try to extract just the year if full parse fails
     try:
@@ -102,118 +143,111 @@ def parse_date(date_str: str | None) -> tuple[datetime | None, int | None]:
     return None, None
 
 
-def parse_amazon_prime_csv(file: BinaryIO) -> ParseResult:
-    """Parse an Amazon Prime Video watch history CSV file.
+# Bytes decoded up front to pick the CSV encoding before parsing
+ENCODING_PROBE_BYTES = 4096
+
+# Columns every Amazon Prime watch history export must have
+REQUIRED_COLUMNS = frozenset({"Type", "Title"})
 
-    Reads the CSV file, filters for movies (excluding TV series),
-    and extracts relevant fields for TMDB matching.
+
+def _empty_result(parse_errors: int = 0) -> ParseResult:
+    """Build a ParseResult with no movies.
 
     Args:
-        file: Binary file object containing CSV data.
+        parse_errors: Number of errors to report.
 
     Returns:
-        ParseResult with list of movies and parsing statistics.
+        ParseResult with zero entries.
+    """
+    return ParseResult(
+        movies=[],
+        total_entries=0,
+        movies_found=0,
+        tv_shows_filtered=0,
+        parse_errors=parse_errors,
+    )
 
-    Note:
-        - Tries UTF-8 encoding first, falls back to Latin-1 for Windows exports
-        - Skips rows with empty titles or missing required columns
-        - Filters out entries where Type is not "Movie" (case-insensitive)
-        - Returns empty result with parse_errors=1 if file cannot be read
+
+def _parse_csv_text(text: TextIO) -> ParseResult:
+    """Parse decoded CSV text into movies.
+
+    Rows are read lazily from the stream, so decoding errors surface as
+    UnicodeDecodeError while iterating and are left to the caller.
+
+    Args:
+        text: Text stream positioned at the start of the CSV.
+
+    Returns:
+        ParseResult with list of movies and parsing statistics.
     """
     movies: list[ParsedMovie] = []
     total_entries = 0
     tv_shows_filtered = 0
     parse_errors = 0
 
-    try:
-        # Decode file content - try UTF-8 first, then Latin-1 for Windows exports
+    reader = csv.reader(text)
+    header = next(reader, None)
+
+    # Handle empty file (csv skips blank lines, so a whitespace-only file
+    # shows up as a single blank header)
+    if header is None or (not "".join(header).strip() and not text.read().strip()):
+        logger.warning("CSV file is empty")
+        return _empty_result()
+
+    # Validate required columns exist
+    missing = REQUIRED_COLUMNS.difference(header)
+    if missing:
+        logger.error(f"CSV missing required columns: {sorted(missing)}")
+        return _empty_result(parse_errors=1)
+
+    # Resolve column positions once; rows are then indexed directly
+    type_index = header.index("Type")
+    title_index = header.index("Title")
+    date_index = header.index("Date Watched") if "Date Watched" in header else None
+    image_index = header.index("Image URL") if "Image URL" in header else None
+
+    for row in reader:
+        if not row:
+            continue
+        total_entries += 1
+
         try:
-            content = file.read().decode("utf-8")
-        except UnicodeDecodeError:
-            file.seek(0)
-            content = file.read().decode("latin-1")
-
-        # Handle empty file
-        if not content.strip():
-            logger.warning("CSV file is empty")
-            return ParseResult(
-                movies=[],
-                total_entries=0,
-                movies_found=0,
-                tv_shows_filtered=0,
-                parse_errors=0,
-            )
+            # Filter out TV series first, before any work on the title
+            # (case-insensitive comparison; Amazon writes "Movie", so that
+            # spelling skips the lower() copy). A short row raises
+            # IndexError here or below and is counted as a parse error.
+            content_type = row[type_index].strip()
+            if content_type != "Movie" and content_type.lower() != "movie":
+                tv_shows_filtered += 1
+                continue
 
-        reader = csv.DictReader(io.StringIO(content))
-
-        # Validate required columns exist
-        if reader.fieldnames is None:
-            logger.error("CSV file has no headers")
-            return ParseResult(
-                movies=[],
-                total_entries=0,
-                movies_found=0,
-                tv_shows_filtered=0,
-                parse_errors=1,
-            )
+            title = row[title_index].strip()
+            if not title:
+                parse_errors += 1
+                logger.debug(f"Row {total_entries}: Empty title, skipping")
+                continue
 
-        required_columns = {"Type", "Title"}
-        missing = required_columns - set(reader.fieldnames)
-        if missing:
-            logger.error(f"CSV missing required columns: {missing}")
-            return ParseResult(
-                movies=[],
-                total_entries=0,
-                movies_found=0,
-                tv_shows_filtered=0,
-                parse_errors=1,
+            # Parse optional fields
+            watch_date, year = parse_date(
+                row[date_index] if date_index is not None else None
             )
-
-        for row in reader:
-            total_entries += 1
-
-            try:
-                # Get required fields
-                content_type = row.get("Type", "").strip()
-                title = row.get("Title", "").strip()
-
-                if not title:
-                    parse_errors += 1
-                    logger.debug(f"Row {total_entries}: Empty title, skipping")
-                    continue
-
-                # Filter out TV series (case-insensitive comparison)
-                if content_type.lower() != "movie":
-                    tv_shows_filtered += 1
-                    continue
-
-                # Parse optional fields
-                watch_date, year = parse_date(row.get("Date Watched"))
-                image_url = row.get("Image URL", "").strip() or None
-
-                movies.append(
-                    ParsedMovie(
-                        title=title,
-                        watch_date=watch_date,
-                        year=year,
-                        prime_image_url=image_url,
-                    )
+            image_url = (
+                row[image_index].strip() if image_index is not None else ""
+            ) or None
+
+            movies.append(
+                ParsedMovie(
+                    title=title,
+                    watch_date=watch_date,
+                    year=year,
+                    prime_image_url=image_url,
                 )
+            )
 
-            except Exception as e:
-                logger.warning(f"Error parsing row {total_entries}: {e}")
-                parse_errors += 1
-                continue
-
-    except Exception as e:
-        logger.error(f"Error reading CSV file: {e}")
-        return ParseResult(
-            movies=[],
-            total_entries=0,
-            movies_found=0,
-            tv_shows_filtered=0,
-            parse_errors=1,
-        )
+        except Exception as e:
+            logger.warning(f"Error parsing row {total_entries}: {e}")
+            parse_errors += 1
+            continue
 
     return ParseResult(
         movies=movies,
@@ -222,3 +256,50 @@ def parse_amazon_prime_csv(file: BinaryIO) -> ParseResult:
         tv_shows_filtered=tv_shows_filtered,
         parse_errors=parse_errors,
     )
+
+
+def parse_amazon_prime_csv(file: BinaryIO) -> ParseResult:
+    """Parse an Amazon Prime Video watch history CSV file.
+
+    Reads the CSV file, filters for movies (excluding TV series),
+    and extracts relevant fields for TMDB matching. The file is decoded
+    incrementally rather than loaded into memory as one string.
+
+    Args:
+        file: Binary file object containing CSV data.
+
+    Returns:
+        ParseResult with list of movies and parsing statistics.
+
+    Note:
+        - Tries UTF-8 encoding first, falls back to Latin-1 for Windows exports
+        - Skips rows with empty titles or missing required columns
+        - Filters out entries where Type is not "Movie" (case-insensitive)
+        - Returns empty result with parse_errors=1 if file cannot be read
+    """
+    try:
+        # Decode file content - try UTF-8 first, then Latin-1 for Windows exports.
+        # Most non-UTF-8 exports fail within the first few rows, so probe
+        # the head before parsing; a later error still restarts in Latin-1.
+        encodings = ("utf-8", "latin-1")
+        head = file.read(ENCODING_PROBE_BYTES)
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        except UnicodeDecodeError:
+            encodings = ("latin-1",)
+
+        for encoding in encodings:
+            file.seek(0)
+            text = io.TextIOWrapper(file, encoding=encoding, newline="")
+            try:
+                return _parse_csv_text(text)
+            except UnicodeDecodeError:
+                if encoding == "latin-1":
+                    raise
+            finally:
+                # Don't let the wrapper close the caller's file
+                text.detach()
+    except Exception as e:
+        logger.error(f"Error reading CSV file: {e}")
+
+    return _empty_result(parse_errors=1)
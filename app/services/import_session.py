@@ -11,10 +11,12 @@ Session Pattern:
 - User ownership enforced on all session access
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+from app.schemas.import_amazon import MatchedMovieItem
+
 
 @dataclass
 class ImportSession:
@@ -22,7 +24,7 @@ class ImportSession:
 
     Attributes:
         user_id: UUID string of the user who owns this session.
-        movies: List of MatchedMovieItem dicts for the review workflow.
+        movies: MatchedMovieItem models for the review workflow (mutated in place).
         created_at: When the session was created (naive UTC).
         current_index: Current position in the review queue.
         added_count: Number of movies added to rankings.
@@ -34,7 +36,7 @@ class ImportSession:
     """
 
     user_id: str
-    movies: list[dict[str, Any]]
+    movies: list[MatchedMovieItem]
     created_at: datetime
     current_index: int = 0
     added_count: int = 0
@@ -55,6 +57,10 @@ class ImportSessionStore:
     - 500 movie limit per session
     - User ownership validation
 
+    Methods never await, so each one runs to completion on the event loop
+    without a lock. Writes are ordered so the user-to-session mapping never
+    points at a removed session, even if a stale session is deleted late.
+
     Example:
         store = ImportSessionStore()
 
@@ -79,17 +85,19 @@ class ImportSessionStore:
     """
 
     SESSION_TTL_MINUTES = 30
+    SESSION_TTL = timedelta(minutes=SESSION_TTL_MINUTES)
     MAX_MOVIES_PER_SESSION = 500
 
     def __init__(self) -> None:
         """Initialize the session store with empty session maps."""
+        # Insertion order is creation order, so the oldest sessions come first
         self._sessions: dict[str, ImportSession] = {}
         self._user_sessions: dict[str, str] = {}  # user_id -> session_id mapping
 
     def create_session(
         self,
         user_id: str,
-        movies: list[dict[str, Any]],
+        movies: list[MatchedMovieItem],
         total_entries: int,
         movies_found: int,
         tv_shows_filtered: int,
@@ -99,7 +107,7 @@ class ImportSessionStore:
 
         Args:
             user_id: UUID string of the user creating the session.
-            movies: List of MatchedMovieItem dicts to include in the session.
+            movies: List of MatchedMovieItem models to include in the session.
             total_entries: Total number of CSV rows parsed.
             movies_found: Number of movie entries identified.
             tv_shows_filtered: Number of TV series entries filtered out.
@@ -115,11 +123,6 @@ class ImportSessionStore:
         """
         import uuid
 
-        # Remove existing session for this user (replacement policy)
-        if user_id in self._user_sessions:
-            old_session_id = self._user_sessions[user_id]
-            self._sessions.pop(old_session_id, None)
-
         # Generate unique session ID
         session_id = str(uuid.uuid4())
 
@@ -136,7 +139,13 @@ class ImportSessionStore:
             tv_shows_filtered=tv_shows_filtered,
             already_ranked=already_ranked,
         )
+
+        # Point the user at the new session before removing the old one
+        # (replacement policy), so the user always maps to a live session
+        old_session_id = self._user_sessions.get(user_id)
         self._user_sessions[user_id] = session_id
+        if old_session_id is not None:
+            self._sessions.pop(old_session_id, None)
 
         return session_id
 
@@ -166,8 +175,7 @@ class ImportSessionStore:
             return None
 
         # Check expiry
-        now = datetime.utcnow()
-        if now - session.created_at > timedelta(minutes=self.SESSION_TTL_MINUTES):
+        if datetime.utcnow() - session.created_at > self.SESSION_TTL:
             self.delete_session(session_id)
             return None
 
@@ -217,16 +225,20 @@ class ImportSessionStore:
             session_id: The unique session ID to delete.
 
         Note:
-            This also removes the user-to-session mapping.
+            This also removes the user-to-session mapping, unless the user
+            has since moved on to a newer session.
             Safe to call even if session doesn't exist.
         """
         session = self._sessions.pop(session_id, None)
-        if session:
-            self._user_sessions.pop(session.user_id, None)
+        if session and self._user_sessions.get(session.user_id) == session_id:
+            del self._user_sessions[session.user_id]
 
     def cleanup_expired(self) -> int:
         """Remove all expired sessions from the store.
 
+        Sessions are stored in creation order, so the scan stops at the
+        first session that is still live instead of visiting every one.
+
         Returns:
             The number of sessions that were removed.
 
@@ -234,12 +246,12 @@ class ImportSessionStore:
             This can be called periodically to prevent memory buildup.
             Each get_session() call also cleans up individual expired sessions.
         """
-        now = datetime.utcnow()
-        expired = [
-            sid
-            for sid, session in self._sessions.items()
-            if now - session.created_at > timedelta(minutes=self.SESSION_TTL_MINUTES)
-        ]
+        cutoff = datetime.utcnow() - self.SESSION_TTL
+        expired = []
+        for sid, session in self._sessions.items():
+            if session.created_at >= cutoff:
+                break
+            expired.append(sid)
         for sid in expired:
             self.delete_session(sid)
         return len(expired)
@@ -4,21 +4,61 @@ This module provides async functions to search for movies using
 The Movie Database (TMDB) API.
 """
 
+import asyncio
 import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
+from pydantic_core import from_json
 
 from app.config import settings
+from app.services.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
-# HTTP client timeout configuration
+# HTTP client configuration
 TMDB_TIMEOUT = 10.0  # seconds
+TMDB_MAX_CONNECTIONS = 100
+TMDB_MAX_KEEPALIVE_CONNECTIONS = 50
 
+# Search result cache configuration
+SEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60
+SEARCH_CACHE_MAX_ENTRIES = 4096
+DETAILS_CACHE_MAX_ENTRIES = 4096
 
-@dataclass
+# Outbound request throttling (TMDB allows roughly 40 requests per 10 seconds)
+TMDB_MAX_CONCURRENT_REQUESTS = 8
+TMDB_RATE_LIMIT_REQUESTS = 40
+TMDB_RATE_LIMIT_WINDOW_SECONDS = 10.0
+# Share of each window that bulk (background) work such as imports may not
+# use, so interactive searches are never starved behind a large upload
+TMDB_INTERACTIVE_RESERVED_REQUESTS = 10
+
+
+def normalize_search_query(query: str) -> str:
+    """Normalize a search query so trivially different searches share a key.
+
+    Only casefolds and collapses whitespace, so "The  Matrix" and
+    "the matrix" share an entry. Punctuation and articles are kept because
+    TMDB can return different results for them ("It" vs "It!", "The Thing"
+    vs "Thing"), and a cache entry holds results fetched for one raw query.
+
+    Args:
+        query: Raw search query.
+
+    Returns:
+        Normalized query.
+    """
+    return " ".join(query.casefold().split())
+
+
+@dataclass(slots=True, frozen=True)
 class TMDBMovieResult:
     """Result from TMDB movie search.
 
@@ -29,7 +69,8 @@ class TMDBMovieResult:
         poster_path: Relative path to poster image (optional).
         poster_url: Full URL to poster thumbnail (optional).
         overview: Movie synopsis/description (optional).
-        genre_ids: List of TMDB genre IDs (optional).
+        genre_ids: Tuple of TMDB genre IDs (optional). A tuple because
+            results are cached and shared between requests.
         vote_average: TMDB user rating 0.0-10.0 (optional).
         vote_count: Number of TMDB votes (optional).
         release_date: Full release date string YYYY-MM-DD (optional).
@@ -42,14 +83,14 @@ class TMDBMovieResult:
     poster_path: str | None
     poster_url: str | None
     overview: str | None
-    genre_ids: list[int] | None = None
+    genre_ids: tuple[int, ...] | None = None
     vote_average: float | None = None
     vote_count: int | None = None
     release_date: str | None = None
     original_language: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TMDBMovieDetails:
     """Movie details from TMDB details endpoint.
 
@@ -64,6 +105,193 @@ class TMDBMovieDetails:
     runtime: int | None
 
 
+# Search results shared across requests and users, keyed by
+# (normalized query, year). Popular titles are searched repeatedly during
+# Amazon Prime imports, so hits skip the TMDB round-trip entirely.
+search_cache: TTLCache[tuple[str, int | None], list[TMDBMovieResult]] = TTLCache(
+    maxsize=SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=SEARCH_CACHE_TTL_SECONDS,
+)
+
+# Movie details keyed by TMDB ID. Importers add the same popular titles, and
+# movies TMDB has no runtime for are re-checked on every later add.
+details_cache: TTLCache[int, TMDBMovieDetails] = TTLCache(
+    maxsize=DETAILS_CACHE_MAX_ENTRIES,
+    ttl_seconds=SEARCH_CACHE_TTL_SECONDS,
+)
+
+
+class TMDBRateLimiter:
+    """Process-wide throttle for outbound TMDB requests.
+
+    Caps the number of in-flight requests with a semaphore and keeps the
+    request rate under TMDB's limit with a sliding window. Callers over the
+    limit wait for capacity instead of failing with a 429. Background
+    callers (bulk imports) may only use the window up to
+    max_requests - reserved_requests, leaving the rest for interactive
+    searches.
+
+    Example:
+        async with tmdb_rate_limiter.limit():
+            response = await client.get(url)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_requests: int,
+        window_seconds: float,
+        reserved_requests: int = 0,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_concurrent: Maximum number of requests in flight at once.
+            max_requests: Maximum requests started per window.
+            window_seconds: Length of the sliding window in seconds.
+            reserved_requests: Requests per window that background callers
+                may not use.
+        """
+        self.max_concurrent = max_concurrent
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.reserved_requests = reserved_requests
+        self._timestamps: deque[float] = deque()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore for the running event loop.
+
+        asyncio primitives are bound to one loop, so a new semaphore is
+        created if the loop changes (e.g. between test cases).
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _wait_for_slot(self, background: bool, record: bool = True) -> None:
+        """Wait until a request can start without exceeding the rate.
+
+        Args:
+            background: Whether to leave the reserved share of the window.
+            record: Whether to stamp the window once a slot is free. Only
+                the final check right before sending records, so stamps
+                match actual send times.
+        """
+        max_requests = self.max_requests - (self.reserved_requests if background else 0)
+        while True:
+            now = time.monotonic()
+            cutoff = now - self.window_seconds
+            while self._timestamps and self._timestamps[0] <= cutoff:
+                self._timestamps.popleft()
+            if len(self._timestamps) < max_requests:
+                if record:
+                    self._timestamps.append(now)
+                return
+            await asyncio.sleep(
+                self.window_seconds
+                - (now - self._timestamps[len(self._timestamps) - max_requests])
+            )
+
+    @asynccontextmanager
+    async def limit(self, background: bool = False) -> AsyncIterator[None]:
+        """Hold a rate slot and a concurrency slot for one request.
+
+        Callers first wait for room in the window without a concurrency
+        slot, so they don't sit on slots that in-flight requests could use.
+        The window is stamped only after the semaphore is acquired, right
+        before the request is sent, so actual sends stay within
+        max_requests per window_seconds.
+
+        Args:
+            background: Whether this is bulk work that must leave the
+                reserved share of the window to interactive callers.
+        """
+        await self._wait_for_slot(background, record=False)
+        async with self._get_semaphore():
+            await self._wait_for_slot(background)
+            yield
+
+    def reset(self) -> None:
+        """Forget recorded requests (used by tests)."""
+        self._timestamps.clear()
+
+
+tmdb_rate_limiter = TMDBRateLimiter(
+    max_concurrent=TMDB_MAX_CONCURRENT_REQUESTS,
+    max_requests=TMDB_RATE_LIMIT_REQUESTS,
+    window_seconds=TMDB_RATE_LIMIT_WINDOW_SECONDS,
+    reserved_requests=TMDB_INTERACTIVE_RESERVED_REQUESTS,
+)
+
+
+# Process-wide HTTP client, so TCP/TLS connections to TMDB are reused
+# across requests instead of being set up for every TMDBService context
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared TMDB HTTP client, creating it on first use.
+
+    The client's connection pool is tied to the event loop that opened it,
+    so a new client is created if the running loop changes.
+
+    Returns:
+        The shared httpx.AsyncClient.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if (
+        _http_client is None
+        or _http_client.is_closed
+        or _http_client_loop is not loop
+    ):
+        _http_client = httpx.AsyncClient(
+            timeout=TMDB_TIMEOUT,
+            headers={"Accept": "application/json"},
+            limits=httpx.Limits(
+                max_connections=TMDB_MAX_CONNECTIONS,
+                max_keepalive_connections=TMDB_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared TMDB HTTP client (called on application shutdown)."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+# TMDB search requests currently in flight, keyed like search_cache
+_inflight_searches: dict[
+    tuple[str, int | None], asyncio.Task[list[TMDBMovieResult]]
+] = {}
+
+
+def _finish_inflight_search(
+    cache_key: tuple[str, int | None],
+    task: asyncio.Task[list[TMDBMovieResult]],
+) -> None:
+    """Remove a completed search from the in-flight table.
+
+    Also marks a failed task's exception as retrieved, since every caller
+    waiting on it may already have been cancelled.
+    """
+    if _inflight_searches.get(cache_key) is task:
+        del _inflight_searches[cache_key]
+    if not task.cancelled():
+        task.exception()
+
+
 class TMDBServiceError(Exception):
     """Base exception for TMDB service errors."""
 
@@ -71,9 +299,34 @@ class TMDBServiceError(Exception):
 
 
 class TMDBRateLimitError(TMDBServiceError):
-    """Raised when TMDB rate limit is exceeded."""
+    """Raised when TMDB rate limit is exceeded.
 
-    pass
+    Attributes:
+        retry_after: Seconds TMDB asked us to wait before retrying, or None
+            if the response had no usable Retry-After header.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize the error with an optional Retry-After delay."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Raw header value.
+
+    Returns:
+        Non-negative delay in seconds, or None if the value is not a number
+        (TMDB never sends the HTTP-date form).
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return max(seconds, 0.0) if math.isfinite(seconds) else None
 
 
 class TMDBAPIError(TMDBServiceError):
@@ -93,26 +346,39 @@ class TMDBService:
             results = await service.search_movies("The Matrix", year=1999)
     """
 
-    def __init__(self) -> None:
-        """Initialize the TMDB service with configuration."""
+    def __init__(self, background: bool = False) -> None:
+        """Initialize the TMDB service with configuration.
+
+        Args:
+            background: Mark this service's requests as bulk work (e.g. an
+                import) that leaves part of the rate limit to interactive
+                searches.
+        """
+        self.background = background
         self.api_key = settings.TMDB_API_KEY
         self.base_url = settings.TMDB_BASE_URL
         self.image_base_url = settings.TMDB_IMAGE_BASE_URL
+        self.search_url = f"{self.base_url}/search/movie"
         self._client: httpx.AsyncClient | None = None
+        # Query parameters shared by every request of each kind
+        self._details_params: dict[str, Any] = {
+            "api_key": self.api_key,
+            "language": "en-US",
+        }
+        self._search_params: dict[str, Any] = {
+            **self._details_params,
+            "include_adult": "false",
+            "page": 1,
+        }
 
     async def __aenter__(self) -> "TMDBService":
-        """Enter async context and create HTTP client."""
-        self._client = httpx.AsyncClient(
-            timeout=TMDB_TIMEOUT,
-            headers={"Accept": "application/json"},
-        )
+        """Enter async context and attach the shared HTTP client."""
+        self._client = get_http_client()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit async context and close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Exit async context, leaving the shared HTTP client open."""
+        self._client = None
 
     def _get_client(self) -> httpx.AsyncClient:
         """Get the HTTP client, raising error if not in context."""
@@ -122,6 +388,35 @@ class TMDBService:
             )
         return self._client
 
+    def _raise_for_status(self, response: httpx.Response) -> None:
+        """Raise the matching service error for a failed TMDB response.
+
+        Args:
+            response: Response from the TMDB API.
+
+        Raises:
+            TMDBRateLimitError: If TMDB rate limit is exceeded.
+            TMDBAPIError: If TMDB returns any other non-200 response.
+        """
+        status_code = response.status_code
+        if status_code == 200:
+            return
+
+        if status_code == 429:
+            retry_after = response.headers.get("Retry-After", "unknown")
+            logger.warning(f"TMDB rate limit exceeded. Retry after: {retry_after}")
+            raise TMDBRateLimitError(
+                f"Rate limit exceeded. Retry after {retry_after} seconds.",
+                retry_after=parse_retry_after(retry_after),
+            )
+
+        if status_code == 401:
+            logger.error("TMDB API authentication failed - check API key")
+            raise TMDBAPIError("Invalid TMDB API key")
+
+        logger.error(f"TMDB API error: {status_code} - {response.text}")
+        raise TMDBAPIError(f"TMDB API returned status {status_code}")
+
     def _build_poster_url(self, poster_path: str | None) -> str | None:
         """Build full poster URL from relative path.
 
@@ -174,7 +469,7 @@ class TMDBService:
             poster_path=poster_path,
             poster_url=self._build_poster_url(poster_path),
             overview=movie.get("overview") or None,
-            genre_ids=genre_ids if genre_ids else None,
+            genre_ids=tuple(genre_ids) if genre_ids else None,
             vote_average=vote_average if vote_average is not None else None,
             vote_count=vote_count if vote_count is not None else None,
             release_date=release_date,
@@ -188,6 +483,10 @@ class TMDBService:
     ) -> list[TMDBMovieResult]:
         """Search for movies by title.
 
+        Results are cached per (query, year) for SEARCH_CACHE_TTL_SECONDS,
+        with queries compared after normalize_search_query(). Concurrent
+        identical searches on a cache miss share a single TMDB request.
+
         Args:
             query: Search query string (movie title).
             year: Optional year filter to narrow results.
@@ -202,46 +501,69 @@ class TMDBService:
         """
         client = self._get_client()
 
-        params: dict[str, Any] = {
-            "api_key": self.api_key,
-            "query": query,
-            "include_adult": "false",
-            "language": "en-US",
-            "page": 1,
-        }
+        cache_key = (normalize_search_query(query), year)
+        cached = search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # Join an identical search already in flight instead of repeating it.
+        # The fetch runs as its own task and is shielded, so one caller being
+        # cancelled does not fail the others waiting on it.
+        task = _inflight_searches.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_search_results(client, query, year, cache_key)
+            )
+            _inflight_searches[cache_key] = task
+            task.add_done_callback(
+                lambda done: _finish_inflight_search(cache_key, done)
+            )
+
+        return list(await asyncio.shield(task))
+
+    async def _fetch_search_results(
+        self,
+        client: httpx.AsyncClient,
+        query: str,
+        year: int | None,
+        cache_key: tuple[str, int | None],
+    ) -> list[TMDBMovieResult]:
+        """Request search results from TMDB and store them in the cache.
+
+        Args:
+            client: Open HTTP client to use for the request.
+            query: Search query string (movie title).
+            year: Optional year filter to narrow results.
+            cache_key: Key to store the results under in search_cache.
+
+        Returns:
+            List of TMDBMovieResult objects.
 
+        Raises:
+            TMDBRateLimitError: If TMDB rate limit is exceeded.
+            TMDBAPIError: If TMDB returns an error response.
+            TMDBServiceError: For other service-related errors.
+        """
+        params = {**self._search_params, "query": query}
         if year is not None:
             params["year"] = year
 
         try:
-            response = await client.get(
-                f"{self.base_url}/search/movie",
-                params=params,
-            )
-
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After", "unknown")
-                logger.warning(f"TMDB rate limit exceeded. Retry after: {retry_after}")
-                raise TMDBRateLimitError(
-                    f"Rate limit exceeded. Retry after {retry_after} seconds."
+            async with tmdb_rate_limiter.limit(background=self.background):
+                response = await client.get(
+                    self.search_url,
+                    params=params,
                 )
 
-            if response.status_code == 401:
-                logger.error("TMDB API authentication failed - check API key")
-                raise TMDBAPIError("Invalid TMDB API key")
-
-            if response.status_code != 200:
-                logger.error(
-                    f"TMDB API error: {response.status_code} - {response.text}"
-                )
-                raise TMDBAPIError(
-                    f"TMDB API returned status {response.status_code}"
-                )
+            self._raise_for_status(response)
 
-            data = response.json()
+            # pydantic-core's parser is about twice as fast as json.loads
+            data = from_json(response.content)
             results = data.get("results", [])
 
-            return [self._parse_movie_result(movie) for movie in results]
+            movies = [self._parse_movie_result(movie) for movie in results]
+            search_cache.set(cache_key, movies)
+            return movies
 
         except httpx.TimeoutException:
             logger.error("TMDB API request timed out")
@@ -254,7 +576,8 @@ class TMDBService:
         """Get movie details from TMDB by ID.
 
         This fetches additional data not available in search results,
-        specifically the runtime.
+        specifically the runtime. Successful lookups are cached per ID for
+        SEARCH_CACHE_TTL_SECONDS.
 
         Args:
             tmdb_id: TMDB movie ID.
@@ -269,45 +592,30 @@ class TMDBService:
         """
         client = self._get_client()
 
-        params: dict[str, Any] = {
-            "api_key": self.api_key,
-            "language": "en-US",
-        }
+        cached = details_cache.get(tmdb_id)
+        if cached is not None:
+            return cached
 
         try:
-            response = await client.get(
-                f"{self.base_url}/movie/{tmdb_id}",
-                params=params,
-            )
-
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After", "unknown")
-                logger.warning(f"TMDB rate limit exceeded. Retry after: {retry_after}")
-                raise TMDBRateLimitError(
-                    f"Rate limit exceeded. Retry after {retry_after} seconds."
+            async with tmdb_rate_limiter.limit(background=self.background):
+                response = await client.get(
+                    f"{self.base_url}/movie/{tmdb_id}",
+                    params=self._details_params,
                 )
 
-            if response.status_code == 401:
-                logger.error("TMDB API authentication failed - check API key")
-                raise TMDBAPIError("Invalid TMDB API key")
-
             if response.status_code == 404:
                 logger.warning(f"Movie not found on TMDB: {tmdb_id}")
                 raise TMDBAPIError(f"Movie {tmdb_id} not found on TMDB")
 
-            if response.status_code != 200:
-                logger.error(
-                    f"TMDB API error: {response.status_code} - {response.text}"
-                )
-                raise TMDBAPIError(
-                    f"TMDB API returned status {response.status_code}"
-                )
+            self._raise_for_status(response)
 
-            data = response.json()
-            return TMDBMovieDetails(
+            data = from_json(response.content)
+            details = TMDBMovieDetails(
                 tmdb_id=data["id"],
                 runtime=data.get("runtime"),
             )
+            details_cache.set(tmdb_id, details)
+            return details
 
         except httpx.TimeoutException:
             logger.error("TMDB API request timed out")
@@ -323,8 +631,7 @@ async def search_movies(
 ) -> list[TMDBMovieResult]:
     """Convenience function to search movies without managing context.
 
-    This creates a new HTTP client for each call. For multiple calls,
-    prefer using TMDBService as a context manager.
+    Wraps a short-lived TMDBService context around the shared HTTP client.
 
     Args:
         query: Search query string (movie title).
@@ -340,8 +647,7 @@ async def search_movies(
 async def get_movie_details(tmdb_id: int) -> TMDBMovieDetails:
     """Convenience function to get movie details without managing context.
 
-    This creates a new HTTP client for each call. For multiple calls,
-    prefer using TMDBService as a context manager.
+    Wraps a short-lived TMDBService context around the shared HTTP client.
 
     Args:
         tmdb_id: TMDB movie ID.
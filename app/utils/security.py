@@ -1,14 +1,17 @@
 """Security utilities for password hashing and JWT token handling."""
 
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import timedelta
+from functools import cache, lru_cache
 
 import bcrypt
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 
 from app.config import settings
 
 # Bcrypt cost factor (work factor)
-BCRYPT_ROUNDS = 12
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -27,8 +30,39 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+@cache
+def _dummy_password_hash() -> bytes:
+    """Return a bcrypt hash to check against when there is no real one.
+
+    Built on first use rather than at import, so cold starts don't pay for
+    an extra bcrypt round.
+    """
+    return bcrypt.hashpw(b"invalid", bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+
+
+def verify_password_or_dummy(plain_password: str, hashed_password: str | None) -> bool:
+    """Verify a password, doing the same bcrypt work when there is no hash.
+
+    Login calls this whether or not the account exists (or has a password),
+    so every failed attempt costs exactly one bcrypt check and response time
+    doesn't reveal which emails are registered.
+
+    Args:
+        plain_password: The plain text password to verify.
+        hashed_password: The user's bcrypt hash, or None for an unknown
+            user or an account without a password.
+
+    Returns:
+        True if a hash was given and the password matches, False otherwise.
+    """
+    if hashed_password is None:
+        bcrypt.checkpw(plain_password.encode("utf-8"), _dummy_password_hash())
+        return False
+    return verify_password(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt with cost factor 12.
+    """Hash a password using bcrypt with the configured cost factor.
 
     Args:
         password: The plain text password to hash.
@@ -41,6 +75,16 @@ def get_password_hash(password: str) -> str:
     return hashed.decode("utf-8")
 
 
+@lru_cache(maxsize=4)
+def _jwt_key(secret_key: str, algorithm: str) -> Key:
+    """Build the JWT signing key once per secret and algorithm.
+
+    python-jose otherwise wraps the raw secret in a new key object on every
+    encode and decode.
+    """
+    return jwk.construct(secret_key, algorithm)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token with the provided data.
 
@@ -54,12 +98,14 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
         Encoded JWT token string.
     """
     to_encode = data.copy()
-    now = datetime.now(timezone.utc)
+    # Claims are NumericDate values (RFC 7519), so use integer timestamps
+    # directly instead of building datetimes for jose to convert back
+    now = int(time.time())
 
     if expires_delta:
-        expire = now + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
     to_encode.update({
         "exp": expire,
@@ -69,7 +115,7 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
 
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
+        _jwt_key(settings.SECRET_KEY, settings.ALGORITHM),
         algorithm=settings.ALGORITHM,
     )
     return encoded_jwt
@@ -109,7 +155,7 @@ def decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
+            _jwt_key(settings.SECRET_KEY, settings.ALGORITHM),
             algorithms=[settings.ALGORITHM],
         )
         return payload
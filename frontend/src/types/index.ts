@@ -91,6 +91,7 @@ export interface RankingListResponse {
   total: number;
   limit: number;
   offset: number;
+  next_cursor?: string | null;
 }
 
 // Sort types
@@ -267,6 +268,17 @@ export interface ImportSessionDetailResponse {
   movies: MatchedMovieItem[];
 }
 
+/**
+ * A window of movies from an import session.
+ * GET /api/v1/import/amazon-prime/session/{session_id}/movies/
+ */
+export interface ImportSessionMoviesPage {
+  items: MatchedMovieItem[];
+  total: number;
+  limit: number;
+  offset: number;
+}
+
 /**
  * Request to add a movie from import session.
  * POST /api/v1/import/amazon-prime/session/{session_id}/movie/{index}/add/
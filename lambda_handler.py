@@ -6,7 +6,11 @@ Mangum wraps the FastAPI ASGI application for AWS Lambda compatibility.
 
 from mangum import Mangum
 
-from app.main import app
+from app.main import app, warm_up
+
+# Lambda runs module-level code in its init phase, before the first request,
+# so do the app's schema warm-up here since the lifespan never runs
+warm_up(app)
 
 # Mangum adapter for AWS Lambda
 # lifespan="off" is required because Lambda doesn't support ASGI lifespan events
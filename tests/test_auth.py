@@ -8,10 +8,13 @@ These tests verify the authentication flow including:
 - Full authentication flow: register -> login -> access protected endpoint
 """
 
+from unittest.mock import patch
+
 import pytest
 from httpx import AsyncClient
 
-from app.utils.security import get_password_hash
+from app.utils import security
+from app.utils.security import get_password_hash, verify_password_or_dummy
 
 
 class TestRegisterEndpoint:
@@ -70,6 +73,29 @@ class TestRegisterEndpoint:
         assert "detail" in data
         assert "already registered" in data["detail"].lower()
 
+    @pytest.mark.asyncio
+    async def test_register_email_domain_is_case_insensitive(
+        self, client: AsyncClient
+    ):
+        """Test that an email differing only in domain case is a duplicate."""
+        first = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "casetest@example.com",
+                "password": "securepassword123",
+            },
+        )
+        second = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "casetest@EXAMPLE.com",
+                "password": "securepassword123",
+            },
+        )
+
+        assert first.status_code == 201
+        assert second.status_code == 409
+
     @pytest.mark.asyncio
     async def test_register_invalid_email_returns_422(self, client: AsyncClient):
         """Test that invalid email format returns 422 validation error."""
@@ -233,6 +259,23 @@ class TestLoginEndpoint:
 
         assert response.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_login_nonexistent_user_still_runs_bcrypt(self, client: AsyncClient):
+        """Test that an unknown email costs a bcrypt check like a wrong password."""
+        with patch.object(
+            security.bcrypt, "checkpw", wraps=security.bcrypt.checkpw
+        ) as checkpw:
+            response = await client.post(
+                "/api/v1/auth/login",
+                data={
+                    "username": "nonexistent@example.com",
+                    "password": "somepassword123",
+                },
+            )
+
+        assert response.status_code == 401
+        assert checkpw.call_count == 1
+
     @pytest.mark.asyncio
     async def test_login_missing_username_returns_422(self, client: AsyncClient):
         """Test that missing username field returns 422."""
@@ -303,6 +346,26 @@ class TestLoginEndpoint:
         assert response.status_code == 401
 
 
+class TestVerifyPasswordOrDummy:
+    """Tests for the timing-safe password check used by login."""
+
+    def test_matches_real_hash(self):
+        """Test a real hash is verified normally."""
+        hashed = get_password_hash("correctpassword")
+
+        assert verify_password_or_dummy("correctpassword", hashed) is True
+        assert verify_password_or_dummy("wrongpassword", hashed) is False
+
+    def test_missing_hash_still_runs_bcrypt(self):
+        """Test a missing hash fails after doing one bcrypt check."""
+        with patch.object(
+            security.bcrypt, "checkpw", wraps=security.bcrypt.checkpw
+        ) as checkpw:
+            assert verify_password_or_dummy("anything", None) is False
+
+        assert checkpw.call_count == 1
+
+
 class TestProtectedEndpoints:
     """Tests for protected endpoints requiring authentication."""
 
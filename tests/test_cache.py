@@ -0,0 +1,59 @@
+"""Tests for the in-process TTL cache.
+
+These tests verify:
+- Values can be stored and retrieved
+- Entries expire after the TTL
+- Least recently used entries are evicted at capacity
+"""
+
+from unittest.mock import patch
+
+from app.services.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned on lookup."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl_seconds=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries older than the TTL are treated as misses."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl_seconds=60)
+
+        with patch("app.services.cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1)
+
+        with patch("app.services.cache.time.monotonic", return_value=1059.0):
+            assert cache.get("a") == 1
+
+        with patch("app.services.cache.time.monotonic", return_value=1060.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the oldest unused entry is dropped when full."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear_removes_all_entries(self):
+        """Test that clear empties the cache."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
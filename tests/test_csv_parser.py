@@ -13,6 +13,9 @@ These tests verify the Amazon Prime CSV parsing functionality including:
 import io
 import pytest
 from datetime import datetime
+from unittest.mock import patch
+
+from app.services import csv_parser
 
 from app.services.csv_parser import (
     ParsedMovie,
@@ -61,6 +64,18 @@ class TestParseDate:
         assert dt == datetime(2024, 1, 15, 10, 30, 0)
         assert year == 2024
 
+    def test_parse_date_invalid_calendar_date_falls_back_to_year(self):
+        """Test that a well-formed but impossible date still yields its year."""
+        dt, year = parse_date("2024-02-30")
+        assert dt is None
+        assert year == 2024
+
+    def test_parse_date_single_digit_month_and_day(self):
+        """Test that unpadded month and day values are accepted."""
+        dt, year = parse_date("1/2/2024")
+        assert dt == datetime(2024, 1, 2)
+        assert year == 2024
+
     def test_parse_date_empty_string(self):
         """Test parsing empty string returns None."""
         dt, year = parse_date("")
@@ -357,6 +372,21 @@ class TestParseAmazonPrimeCsvMalformedRows:
         assert result.movies[0].title == "First Movie"
         assert result.movies[1].title == "Third Movie"
 
+    def test_parse_csv_short_row_and_blank_line(self):
+        """Test a truncated row is a parse error and blank lines are ignored."""
+        csv_content = b"""Date Watched,Type,Title,Image URL
+2024-01-15,Movie,First Movie,https://example.com/1.jpg
+
+2024-01-16,Movie
+2024-01-17,Movie,Third Movie
+"""
+        file = io.BytesIO(csv_content)
+        result = parse_amazon_prime_csv(file)
+
+        assert result.total_entries == 3
+        assert result.parse_errors == 2
+        assert [m.title for m in result.movies] == ["First Movie"]
+
 
 class TestParseAmazonPrimeCsvEncoding:
     """Tests for handling different file encodings."""
@@ -391,6 +421,32 @@ class TestParseAmazonPrimeCsvEncoding:
         assert "Cafe" in result.movies[0].title or "Caf" in result.movies[0].title
         assert "Na" in result.movies[1].title
 
+    def test_parse_early_latin1_byte_parses_once(self):
+        """Test that a non-UTF-8 byte in the first rows skips the UTF-8 attempt."""
+        csv_content = "Date Watched,Type,Title\n2024-01-15,Movie,Caf\xe9\n".encode("latin-1")
+        file = io.BytesIO(csv_content)
+
+        with patch.object(
+            csv_parser, "_parse_csv_text", wraps=csv_parser._parse_csv_text
+        ) as parse_text:
+            result = parse_amazon_prime_csv(file)
+
+        assert parse_text.call_count == 1
+        assert result.movies[0].title == "Caf\xe9"
+
+    def test_parse_late_latin1_byte_restarts_without_duplicates(self):
+        """Test that a non-UTF-8 byte deep in the file restarts parsing cleanly."""
+        header = "Date Watched,Type,Title\n"
+        rows = "2024-01-15,Movie,Plain Title\n" * 5000
+        csv_content = (header + rows + "2024-01-16,Movie,Caf\xe9\n").encode("latin-1")
+        file = io.BytesIO(csv_content)
+        result = parse_amazon_prime_csv(file)
+
+        assert result.total_entries == 5001
+        assert result.movies_found == 5001
+        assert result.movies[-1].title == "Caf\xe9"
+        assert not file.closed
+
 
 class TestParseAmazonPrimeCsvStatistics:
     """Tests for accurate statistics reporting."""
@@ -10,11 +10,13 @@ These tests verify the import functionality including:
 NOTE: All URLs must include trailing slashes.
 """
 
+import asyncio
 import io
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from httpx import AsyncClient
 
+from app.routers.import_amazon import IMPORT_MAX_CONCURRENT_SEARCHES
 from app.services.import_session import import_session_store
 
 
@@ -224,6 +226,111 @@ class TestUploadCSV:
         assert "movies" in data
         assert isinstance(data["movies"], list)
 
+    @pytest.mark.asyncio
+    async def test_upload_keeps_csv_order_when_matching_concurrently(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test matched movies come back in CSV order even if searches finish out of order."""
+        csv_file = create_test_csv(
+            [
+                {"Type": "Movie", "Title": "Slow Movie", "Date Watched": "2024-01-15"},
+                {"Type": "Movie", "Title": "Fast Movie", "Date Watched": "2024-01-16"},
+            ]
+        )
+
+        async def search(query: str, year: int | None = None):
+            if query == "Slow Movie":
+                await asyncio.sleep(0.02)
+            return [create_mock_tmdb_result(tmdb_id=len(query), title=query, year=year)]
+
+        with patch("app.routers.import_amazon.TMDBService") as mock_tmdb_class:
+            mock_instance = AsyncMock()
+            mock_instance.__aenter__.return_value = mock_instance
+            mock_instance.__aexit__.return_value = None
+            mock_instance.search_movies.side_effect = search
+            mock_tmdb_class.return_value = mock_instance
+
+            response = await client.post(
+                "/api/v1/import/amazon-prime/upload/",
+                files={"file": ("test.csv", csv_file, "text/csv")},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 201
+        titles = [m["parsed"]["title"] for m in response.json()["movies"]]
+        assert titles == ["Slow Movie", "Fast Movie"]
+
+    @pytest.mark.asyncio
+    async def test_upload_caps_concurrent_searches(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test an upload runs a bounded number of background TMDB searches."""
+        csv_file = create_test_csv(
+            [
+                {"Type": "Movie", "Title": f"Movie {i}", "Date Watched": "2024-01-15"}
+                for i in range(12)
+            ]
+        )
+        in_flight = 0
+        peak = 0
+
+        async def search(query: str, year: int | None = None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        with patch("app.routers.import_amazon.TMDBService") as mock_tmdb_class:
+            mock_instance = AsyncMock()
+            mock_instance.__aenter__.return_value = mock_instance
+            mock_instance.__aexit__.return_value = None
+            mock_instance.search_movies.side_effect = search
+            mock_tmdb_class.return_value = mock_instance
+
+            response = await client.post(
+                "/api/v1/import/amazon-prime/upload/",
+                files={"file": ("test.csv", csv_file, "text/csv")},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 201
+        assert peak == IMPORT_MAX_CONCURRENT_SEARCHES
+        mock_tmdb_class.assert_called_once_with(background=True)
+
+    @pytest.mark.asyncio
+    async def test_upload_exact_match_has_no_alternatives(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test that an exact title + year match does not collect alternatives."""
+        csv_file = create_test_csv(
+            [
+                {"Type": "Movie", "Title": "Test Movie", "Date Watched": "2024-01-15"},
+            ]
+        )
+
+        with patch("app.routers.import_amazon.TMDBService") as mock_tmdb_class:
+            mock_instance = AsyncMock()
+            mock_instance.__aenter__.return_value = mock_instance
+            mock_instance.__aexit__.return_value = None
+            mock_instance.search_movies.return_value = [
+                create_mock_tmdb_result(tmdb_id=1, title="Test Movie", year=2024),
+                create_mock_tmdb_result(tmdb_id=2, title="Test Movie 2", year=2024),
+            ]
+            mock_tmdb_class.return_value = mock_instance
+
+            response = await client.post(
+                "/api/v1/import/amazon-prime/upload/",
+                files={"file": ("test.csv", csv_file, "text/csv")},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 201
+        movie = response.json()["movies"][0]
+        assert movie["confidence"] == 1.0
+        assert movie["alternatives"] == []
+
 
 class TestGetSession:
     """Tests for GET /api/v1/import/amazon-prime/session/{session_id}/ endpoint."""
@@ -337,6 +444,82 @@ class TestGetSession:
         assert response.status_code == 401
 
 
+class TestGetSessionMovies:
+    """Tests for GET /api/v1/import/amazon-prime/session/{session_id}/movies/ endpoint."""
+
+    async def _upload(self, client: AsyncClient, auth_headers: dict, titles: list[str]) -> str:
+        """Upload a CSV with the given movie titles and return the session ID."""
+        csv_file = create_test_csv([{"Type": "Movie", "Title": title} for title in titles])
+
+        with patch("app.routers.import_amazon.TMDBService") as mock_tmdb_class:
+            mock_instance = AsyncMock()
+            mock_instance.__aenter__.return_value = mock_instance
+            mock_instance.__aexit__.return_value = None
+
+            async def search(query, year=None):
+                tmdb_id = titles.index(query) + 1
+                return [create_mock_tmdb_result(tmdb_id=tmdb_id, title=query, year=2024)]
+
+            mock_instance.search_movies.side_effect = search
+            mock_tmdb_class.return_value = mock_instance
+
+            upload_response = await client.post(
+                "/api/v1/import/amazon-prime/upload/",
+                files={"file": ("test.csv", csv_file, "text/csv")},
+                headers=auth_headers,
+            )
+
+        return upload_response.json()["session_id"]
+
+    @pytest.mark.asyncio
+    async def test_returns_requested_window(self, client: AsyncClient, auth_headers: dict):
+        """Test that only the requested slice of movies is returned."""
+        titles = ["Movie A", "Movie B", "Movie C", "Movie D"]
+        session_id = await self._upload(client, auth_headers, titles)
+
+        response = await client.get(
+            f"/api/v1/import/amazon-prime/session/{session_id}/movies/",
+            params={"offset": 1, "limit": 2},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 4
+        assert data["offset"] == 1
+        assert data["limit"] == 2
+        assert [item["parsed"]["title"] for item in data["items"]] == ["Movie B", "Movie C"]
+
+    @pytest.mark.asyncio
+    async def test_session_detail_can_omit_movies(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test that include_movies=false returns counts without the movie list."""
+        session_id = await self._upload(client, auth_headers, ["Movie A", "Movie B"])
+
+        response = await client.get(
+            f"/api/v1/import/amazon-prime/session/{session_id}/",
+            params={"include_movies": "false"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_movies"] == 2
+        assert data["remaining_count"] == 2
+        assert data["movies"] == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_session_returns_404(self, client: AsyncClient, auth_headers: dict):
+        """Test that paging an unknown session returns 404."""
+        response = await client.get(
+            "/api/v1/import/amazon-prime/session/invalid-session-id/movies/",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
+
+
 class TestAddMovie:
     """Tests for POST /api/v1/import/amazon-prime/session/{session_id}/movie/{index}/add/ endpoint."""
 
@@ -495,6 +495,28 @@ class TestImportSessionStoreDelete:
 
         assert "user-1" not in store._user_sessions
 
+    def test_delete_stale_session_keeps_newer_user_mapping(self):
+        """Test deleting an older session doesn't unmap the user's newer one."""
+        store = ImportSessionStore()
+        store._sessions["stale-session"] = ImportSession(
+            user_id="user-1",
+            movies=[],
+            created_at=datetime.utcnow() - timedelta(minutes=31),
+        )
+
+        session_id = store.create_session(
+            user_id="user-1",
+            movies=[],
+            total_entries=0,
+            movies_found=0,
+            tv_shows_filtered=0,
+            already_ranked=0,
+        )
+
+        assert store.cleanup_expired() == 1
+        assert store._user_sessions["user-1"] == session_id
+        assert store.get_session(session_id, "user-1") is not None
+
     def test_delete_nonexistent_session_is_safe(self):
         """Test that deleting non-existent session doesn't raise error."""
         store = ImportSessionStore()
@@ -307,6 +307,37 @@ class TestSearchMovies:
         assert data["results"] == []
         assert data["query"] == "nonexistentmovie12345"
 
+    @pytest.mark.asyncio
+    async def test_search_movies_leaves_caching_to_service(
+        self, client: AsyncClient, auth_headers: dict, mock_tmdb_results
+    ):
+        """Test every search goes through the service, which owns the cache."""
+        with patch(
+            "app.routers.movies.TMDBService"
+        ) as MockTMDBService:
+            mock_service = AsyncMock()
+            mock_service.__aenter__.return_value = mock_service
+            mock_service.__aexit__.return_value = None
+            mock_service.search_movies.return_value = mock_tmdb_results
+            MockTMDBService.return_value = mock_service
+
+            first = await client.get(
+                "/api/v1/movies/search/",
+                params={"q": "matrix"},
+                headers=auth_headers,
+            )
+            second = await client.get(
+                "/api/v1/movies/search/",
+                params={"q": " Matrix "},
+                headers=auth_headers,
+            )
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json()["results"] == first.json()["results"]
+        assert second.json()["query"] == " Matrix "
+        assert mock_service.search_movies.call_count == 2
+
     @pytest.mark.asyncio
     async def test_search_movies_requires_authentication(
         self, client: AsyncClient
@@ -370,6 +401,41 @@ class TestSearchMovies:
         data = response.json()
         assert "rate limit" in data["detail"].lower()
 
+    @pytest.mark.asyncio
+    async def test_search_movies_rate_limit_serves_stale_results(
+        self, client: AsyncClient, auth_headers: dict, mock_tmdb_results
+    ):
+        """Test search falls back to the last known results when TMDB fails."""
+        with patch(
+            "app.routers.movies.TMDBService"
+        ) as MockTMDBService:
+            mock_service = AsyncMock()
+            mock_service.__aenter__.return_value = mock_service
+            mock_service.__aexit__.return_value = None
+            mock_service.search_movies.return_value = mock_tmdb_results
+            MockTMDBService.return_value = mock_service
+
+            await client.get(
+                "/api/v1/movies/search/",
+                params={"q": "matrix"},
+                headers=auth_headers,
+            )
+
+            # TMDB starts rate limiting
+            mock_service.search_movies.side_effect = TMDBRateLimitError(
+                "Rate limit exceeded"
+            )
+
+            response = await client.get(
+                "/api/v1/movies/search/",
+                params={"q": "matrix"},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == "STALE"
+        assert len(response.json()["results"]) == 2
+
     @pytest.mark.asyncio
     async def test_search_movies_api_error_returns_500(
         self, client: AsyncClient, auth_headers: dict
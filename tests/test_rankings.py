@@ -6,6 +6,9 @@ These tests verify the rankings functionality including:
 - Deleting rankings (including the trailing slash fix)
 """
 
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from httpx import AsyncClient
 
@@ -105,6 +108,40 @@ class TestCreateRanking:
         # rated_at should still be the original date
         assert data["rated_at"].startswith("2025-06-15")
 
+    @pytest.mark.asyncio
+    async def test_create_ranking_unknown_movie_returns_404(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test ranking a nonexistent movie returns 404 on every attempt."""
+        payload = {
+            "movie_id": "00000000-0000-0000-0000-000000000000",
+            "rating": 4,
+        }
+
+        for _ in range(2):
+            response = await client.post(
+                "/api/v1/rankings/", json=payload, headers=auth_headers
+            )
+            assert response.status_code == 404
+            assert response.json()["detail"] == "Movie not found"
+
+    @pytest.mark.asyncio
+    async def test_create_ranking_unknown_field_returns_422(
+        self, client: AsyncClient, auth_headers: dict, test_movie: dict
+    ):
+        """Test that a misspelled field is rejected instead of ignored."""
+        response = await client.post(
+            "/api/v1/rankings/",
+            json={
+                "movie_id": test_movie["movie_id"],
+                "rating": 4,
+                "rated_on": "2025-01-01",
+            },
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+
 
 class TestListRankings:
     """Tests for GET /api/v1/rankings/ endpoint."""
@@ -151,6 +188,222 @@ class TestListRankings:
         assert data["items"][0]["rating"] == 4
         assert "rated_at" in data["items"][0]
 
+    @pytest.mark.asyncio
+    async def test_list_rankings_offset_past_end_reports_total(
+        self, client: AsyncClient, auth_headers: dict, test_movie: dict
+    ):
+        """Test an empty page past the end still reports the real total."""
+        await client.post(
+            "/api/v1/rankings/",
+            json={
+                "movie_id": test_movie["movie_id"],
+                "rating": 4,
+            },
+            headers=auth_headers,
+        )
+
+        response = await client.get(
+            "/api/v1/rankings/",
+            params={"offset": 5},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_list_rankings_sort_by_year_puts_missing_years_last(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test year sorting in both directions keeps movies without a year last."""
+        for movie in (
+            {"title": "Old Movie", "year": 1990},
+            {"title": "Undated Movie"},
+            {"title": "New Movie", "year": 2020},
+        ):
+            created = await client.post(
+                "/api/v1/movies/", json=movie, headers=auth_headers
+            )
+            await client.post(
+                "/api/v1/rankings/",
+                json={"movie_id": created.json()["id"], "rating": 3},
+                headers=auth_headers,
+            )
+
+        for sort_order, expected in (
+            ("asc", ["Old Movie", "New Movie", "Undated Movie"]),
+            ("desc", ["New Movie", "Old Movie", "Undated Movie"]),
+        ):
+            response = await client.get(
+                "/api/v1/rankings/",
+                params={"sort_by": "year", "sort_order": sort_order},
+                headers=auth_headers,
+            )
+
+            assert response.status_code == 200
+            titles = [item["movie"]["title"] for item in response.json()["items"]]
+            assert titles == expected
+
+    @pytest.mark.asyncio
+    async def test_list_rankings_cursor_pagination(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test walking all pages with next_cursor returns every ranking once."""
+        for i in range(5):
+            created = await client.post(
+                "/api/v1/movies/",
+                json={"title": f"Movie {i}", "year": 2000 + i},
+                headers=auth_headers,
+            )
+            await client.post(
+                "/api/v1/rankings/",
+                json={
+                    "movie_id": created.json()["id"],
+                    "rating": 3,
+                    # Two rankings share a timestamp to exercise the id tie-break
+                    "rated_at": f"2025-01-0{min(i, 3) + 1}T12:00:00Z",
+                },
+                headers=auth_headers,
+            )
+
+        seen: list[str] = []
+        params = {"limit": 2}
+        while True:
+            response = await client.get(
+                "/api/v1/rankings/", params=params, headers=auth_headers
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 5
+            seen.extend(item["movie"]["title"] for item in data["items"])
+            if data["next_cursor"] is None:
+                break
+            params = {"limit": 2, "cursor": data["next_cursor"]}
+
+        assert len(seen) == 5
+        assert set(seen) == {f"Movie {i}" for i in range(5)}
+        assert seen[0] in ("Movie 3", "Movie 4")
+
+    @pytest.mark.asyncio
+    async def test_list_rankings_invalid_cursor_returns_400(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test a malformed cursor is rejected."""
+        response = await client.get(
+            "/api/v1/rankings/",
+            params={"cursor": "not-a-cursor"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_list_rankings_etag_returns_304_until_rankings_change(
+        self, client: AsyncClient, auth_headers: dict, test_movie: dict
+    ):
+        """Test If-None-Match with a current ETag returns 304, and 200 after a change."""
+        first = await client.get("/api/v1/rankings/", headers=auth_headers)
+        etag = first.headers["ETag"]
+
+        cached = await client.get(
+            "/api/v1/rankings/",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        await client.post(
+            "/api/v1/rankings/",
+            json={"movie_id": test_movie["movie_id"], "rating": 4},
+            headers=auth_headers,
+        )
+
+        changed = await client.get(
+            "/api/v1/rankings/",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_list_rankings_etag_changes_when_ranked_movie_is_backfilled(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test an import filling in a ranked movie's metadata invalidates the ETag."""
+        movie = await client.post(
+            "/api/v1/movies/",
+            json={"title": "Backfill Movie", "year": 2024, "tmdb_id": 4242},
+            headers=auth_headers,
+        )
+        await client.post(
+            "/api/v1/rankings/",
+            json={"movie_id": movie.json()["id"], "rating": 4},
+            headers=auth_headers,
+        )
+        first = await client.get("/api/v1/rankings/", headers=auth_headers)
+        etag = first.headers["ETag"]
+        assert first.json()["items"][0]["movie"]["genre_ids"] is None
+
+        # Another user's import matches the same TMDB movie with more metadata
+        other = await client.post(
+            "/api/v1/auth/register",
+            json={"email": "backfill@example.com", "password": "password123"},
+        )
+        other_headers = {"Authorization": f"Bearer {other.json()['access_token']}"}
+        csv_file = io.BytesIO(
+            b"Date Watched,Type,Title,Episode Title,Global Title Identifier,"
+            b"Episode Global Title Identifier,Path,Episode Path,Image URL\n"
+            b"2024-01-15,Movie,Backfill Movie,,,,,,\n"
+        )
+        match = MagicMock()
+        match.tmdb_id = 4242
+        match.title = "Backfill Movie"
+        match.year = 2024
+        match.poster_url = None
+        match.overview = None
+        match.genre_ids = (18,)
+        match.vote_average = None
+        match.vote_count = None
+        match.release_date = None
+        match.original_language = None
+
+        with patch("app.routers.import_amazon.TMDBService") as mock_tmdb_class:
+            mock_instance = AsyncMock()
+            mock_instance.__aenter__.return_value = mock_instance
+            mock_instance.__aexit__.return_value = None
+            mock_instance.search_movies.return_value = [match]
+            mock_tmdb_class.return_value = mock_instance
+
+            upload = await client.post(
+                "/api/v1/import/amazon-prime/upload/",
+                files={"file": ("test.csv", csv_file, "text/csv")},
+                headers=other_headers,
+            )
+
+        session_id = upload.json()["session_id"]
+        with patch(
+            "app.routers.import_amazon.get_movie_details",
+            new_callable=AsyncMock,
+            side_effect=Exception("TMDB unavailable"),
+        ):
+            added = await client.post(
+                f"/api/v1/import/amazon-prime/session/{session_id}/movie/0/add/",
+                json={"rating": 3},
+                headers=other_headers,
+            )
+        assert added.status_code == 201
+
+        changed = await client.get(
+            "/api/v1/rankings/",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["items"][0]["movie"]["genre_ids"] == [18]
+
 
 class TestDeleteRanking:
     """Tests for DELETE /api/v1/rankings/{ranking_id}/ endpoint.
@@ -9,6 +9,9 @@ These tests verify the TMDB service functionality including:
 All tests use mocking to avoid making real API calls.
 """
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -19,7 +22,10 @@ from app.services.tmdb import (
     TMDBMovieResult,
     TMDBRateLimitError,
     TMDBAPIError,
+    TMDBRateLimiter,
     TMDBServiceError,
+    normalize_search_query,
+    parse_retry_after,
     search_movies,
 )
 
@@ -171,6 +177,121 @@ class TestTMDBServiceHelpers:
         assert result.overview is None
 
 
+class TestNormalizeSearchQuery:
+    """Tests for search query normalization used by the search cache."""
+
+    def test_case_and_whitespace_are_ignored(self):
+        """Test case and runs of whitespace don't change the key."""
+        assert normalize_search_query("The Godfather") == "the godfather"
+        assert normalize_search_query("  the   GODFATHER ") == "the godfather"
+
+    def test_punctuation_and_articles_are_kept(self):
+        """Test queries TMDB may answer differently keep distinct keys."""
+        assert normalize_search_query("It") != normalize_search_query("It!")
+        assert normalize_search_query("The Thing") != normalize_search_query("Thing")
+        assert normalize_search_query("Spider-Man") == "spider-man"
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_numeric_seconds(self):
+        """Test delay-seconds values are parsed and negatives clamp to zero."""
+        assert parse_retry_after("30") == 30.0
+        assert parse_retry_after("1.5") == 1.5
+        assert parse_retry_after("-3") == 0.0
+
+    def test_unusable_values_return_none(self):
+        """Test non-numeric and non-finite values are ignored."""
+        assert parse_retry_after("unknown") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+        assert parse_retry_after("nan") is None
+
+
+class TestTMDBRateLimiter:
+    """Tests for the outbound TMDB request throttle."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_requests(self):
+        """Test no more than max_concurrent requests run at once."""
+        limiter = TMDBRateLimiter(
+            max_concurrent=2, max_requests=100, window_seconds=10.0
+        )
+        in_flight = 0
+        peak = 0
+
+        async def fake_request():
+            nonlocal in_flight, peak
+            async with limiter.limit():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(fake_request() for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_waits_when_window_is_full(self):
+        """Test requests over the rate wait for the window instead of failing."""
+        limiter = TMDBRateLimiter(
+            max_concurrent=10, max_requests=2, window_seconds=0.2
+        )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        for _ in range(3):
+            async with limiter.limit():
+                pass
+
+        assert loop.time() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_background_requests_leave_reserved_share(self):
+        """Test background callers stop short of the reserve; interactive don't."""
+        limiter = TMDBRateLimiter(
+            max_concurrent=10,
+            max_requests=3,
+            window_seconds=10.0,
+            reserved_requests=1,
+        )
+
+        for _ in range(2):
+            async with limiter.limit(background=True):
+                pass
+
+        # A third background request has to wait for the window...
+        with pytest.raises(asyncio.TimeoutError):
+            async with asyncio.timeout(0.05):
+                async with limiter.limit(background=True):
+                    pass
+
+        # ...but an interactive request can still use the reserved slot
+        async with asyncio.timeout(0.05):
+            async with limiter.limit():
+                pass
+
+    @pytest.mark.asyncio
+    async def test_requests_queued_for_concurrency_stay_under_rate(self):
+        """Test the window counts actual sends, not grants queued on the semaphore."""
+        limiter = TMDBRateLimiter(max_concurrent=1, max_requests=2, window_seconds=0.2)
+        loop = asyncio.get_running_loop()
+        sent: list[float] = []
+
+        async def request(hold: float) -> None:
+            async with limiter.limit():
+                sent.append(loop.time())
+                await asyncio.sleep(hold)
+
+        await asyncio.gather(request(0.3), request(0), request(0), request(0))
+
+        assert len(sent) == 4
+        # No window may contain more than max_requests sends
+        for earlier, later in zip(sent, sent[2:]):
+            assert later - earlier >= 0.19
+
+
 class TestTMDBServiceContextManager:
     """Tests for TMDBService context manager behavior."""
 
@@ -191,6 +312,17 @@ class TestTMDBServiceContextManager:
 
             assert service._client is None
 
+    @pytest.mark.asyncio
+    async def test_services_share_one_http_client(self):
+        """Test that separate service contexts reuse the same open client."""
+        async with TMDBService() as first:
+            client = first._client
+
+        async with TMDBService() as second:
+            assert second._client is client
+
+        assert not client.is_closed
+
     @pytest.mark.asyncio
     async def test_get_client_raises_without_context(self):
         """Test that _get_client raises error when not in context."""
@@ -224,7 +356,7 @@ class TestTMDBServiceSearchMovies:
         """Test search_movies returns parsed results."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "results": [
                 {
                     "id": 603,
@@ -241,7 +373,7 @@ class TestTMDBServiceSearchMovies:
                     "overview": "Neo fights to save humanity.",
                 },
             ]
-        }
+        }).encode()
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -262,7 +394,7 @@ class TestTMDBServiceSearchMovies:
         """Test search_movies includes year parameter when provided."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"results": []}
+        mock_response.content = json.dumps({"results": []}).encode()
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -280,7 +412,7 @@ class TestTMDBServiceSearchMovies:
         """Test search_movies does not include year parameter when not provided."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"results": []}
+        mock_response.content = json.dumps({"results": []}).encode()
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -296,7 +428,7 @@ class TestTMDBServiceSearchMovies:
         """Test search_movies returns empty list when no results."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"results": []}
+        mock_response.content = json.dumps({"results": []}).encode()
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -306,6 +438,85 @@ class TestTMDBServiceSearchMovies:
 
             assert results == []
 
+    @pytest.mark.asyncio
+    async def test_search_movies_caches_results(self, mock_settings):
+        """Test repeated searches differing only in case reuse cached results."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "results": [{"id": 603, "title": "The Matrix", "release_date": "1999-03-31"}]
+        }).encode()
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = mock_response
+
+            async with TMDBService() as service:
+                first = await service.search_movies("The Matrix", year=1999)
+                second = await service.search_movies("the matrix", year=1999)
+
+            assert mock_get.call_count == 1
+            assert [r.tmdb_id for r in first] == [r.tmdb_id for r in second] == [603]
+
+    @pytest.mark.asyncio
+    async def test_get_movie_details_caches_by_id(self, mock_settings):
+        """Test repeated detail lookups for one movie hit TMDB once."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"id": 603, "runtime": None}).encode()
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = mock_response
+
+            async with TMDBService() as service:
+                first = await service.get_movie_details(603)
+                second = await service.get_movie_details(603)
+
+            assert mock_get.call_count == 1
+            assert first == second
+            assert first.runtime is None
+
+    @pytest.mark.asyncio
+    async def test_search_movies_cache_is_keyed_by_year(self, mock_settings):
+        """Test a different year filter triggers a fresh TMDB request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"results": []}).encode()
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = mock_response
+
+            async with TMDBService() as service:
+                await service.search_movies("The Matrix", year=1999)
+                await service.search_movies("The Matrix", year=2003)
+
+            assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_request(
+        self, mock_settings
+    ):
+        """Test concurrent cache misses for the same search hit TMDB once."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "results": [{"id": 438631, "title": "Dune", "release_date": "2021-09-15"}]
+        }).encode()
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = slow_get
+
+            async with TMDBService() as service:
+                results = await asyncio.gather(
+                    *(service.search_movies("Dune") for _ in range(5))
+                )
+
+            assert mock_get.call_count == 1
+            assert all([r.tmdb_id for r in res] == [438631] for res in results)
+
     @pytest.mark.asyncio
     async def test_search_movies_rate_limit_error(self, mock_settings):
         """Test search_movies raises TMDBRateLimitError on 429 response."""
@@ -322,6 +533,7 @@ class TestTMDBServiceSearchMovies:
 
                 assert "Rate limit exceeded" in str(exc_info.value)
                 assert "30" in str(exc_info.value)
+                assert exc_info.value.retry_after == 30.0
 
     @pytest.mark.asyncio
     async def test_search_movies_invalid_api_key(self, mock_settings):
@@ -384,7 +596,7 @@ class TestTMDBServiceSearchMovies:
         """Test search_movies uses correct API endpoint."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"results": []}
+        mock_response.content = json.dumps({"results": []}).encode()
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -400,7 +612,7 @@ class TestTMDBServiceSearchMovies:
         """Test search_movies includes API key in request."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"results": []}
+        mock_response.content = json.dumps({"results": []}).encode()
 
         with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -420,7 +632,7 @@ class TestConvenienceSearchFunction:
         """Test the convenience search_movies function works correctly."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "results": [
                 {
                     "id": 603,
@@ -430,7 +642,7 @@ class TestConvenienceSearchFunction:
                     "overview": "A computer hacker.",
                 },
             ]
-        }
+        }).encode()
 
         with patch("app.services.tmdb.settings") as mock_settings:
             mock_settings.TMDB_API_KEY = "test-api-key"
@@ -450,7 +662,7 @@ class TestConvenienceSearchFunction:
         """Test the convenience search_movies function with year parameter."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"results": []}
+        mock_response.content = json.dumps({"results": []}).encode()
 
         with patch("app.services.tmdb.settings") as mock_settings:
             mock_settings.TMDB_API_KEY = "test-api-key"